@@ -12,7 +12,7 @@ from typing import Any
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from src.cache_manager import CacheManager
-from src.config_manager import ConfigManager
+from src.config_manager import get_config_manager
 from src.historical_comparison import HistoricalTracker
 from src.pure_browser_automation import PureBrowserAutomationManager, PureBrowserConfig
 from src.report_generator import ReportGenerator
@@ -78,7 +78,7 @@ def main() -> int:
         return 0
 
     # Load configuration
-    config_manager = ConfigManager(args.config)
+    config_manager = get_config_manager(args.config)
     config = config_manager.merge_with_args(args)
 
     # Override headless mode if specified
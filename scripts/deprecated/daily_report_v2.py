@@ -13,7 +13,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from src.browser_automation import BrowserAutomationConfig as BrowserConfig
 from src.cache_manager import CacheManager
-from src.config_manager import ConfigManager
+from src.config_manager import get_config_manager
 from src.enhanced_browser_automation import BrowserAutomationManager
 from src.historical_comparison import HistoricalTracker
 from src.report_generator import ReportGenerator
@@ -75,7 +75,7 @@ def main() -> int:
     args = parser.parse_args()
 
     # Load configuration
-    config_manager = ConfigManager(args.config)
+    config_manager = get_config_manager(args.config)
     config = config_manager.merge_with_args(args)
 
     # Override headless mode if specified
@@ -176,7 +176,7 @@ def main() -> int:
 
     # Initialize browser session
     session = BrowserSession(browser_config)
-    slack = EnhancedSlackBrowserClient(session, browser_config)
+    slack = EnhancedSlackBrowserClient(session, browser_config, cache=cache)
 
     tasks: list[Task] = []
 
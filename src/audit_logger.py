@@ -1,12 +1,11 @@
 import json
 import os
 import sqlite3
-from datetime import datetime, timezone
-from typing import cast
+import threading
+from contextlib import contextmanager
+from typing import Iterator, cast
 
-
-def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+from .utils import utc_now_iso
 
 
 class AuditLogger:
@@ -16,6 +15,11 @@ class AuditLogger:
         self.sqlite_path = sqlite_path
         self.jsonl_path = jsonl_path
         self._db_initialized = False
+        # Run ids are never removed from the registry, so a positive answer can be remembered.
+        self._known_run_ids: set[str] = set()
+        # Records held back by transaction(); None when writing through immediately.
+        self._pending: list[dict] | None = None
+        self._pending_lock = threading.Lock()
 
         if not self.enabled:
             return
@@ -82,32 +86,63 @@ class AuditLogger:
             return
 
         record = {
-            "timestamp": _utc_now_iso(),
+            "timestamp": utc_now_iso(),
             "action": action,
             "status": status,
             "details": details or {},
             "error": error,
         }
 
+        with self._pending_lock:
+            if self._pending is not None:
+                self._pending.append(record)
+                # Failures are written straight away so they survive a crash mid-run.
+                if status != "failed":
+                    return
+                records, self._pending = self._pending, []
+            else:
+                records = [record]
+        self._write_records(records)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Buffer log records and write them in one commit when the block exits."""
+        with self._pending_lock:
+            outermost = self._pending is None
+            if outermost:
+                self._pending = []
+        try:
+            yield
+        finally:
+            if outermost:
+                with self._pending_lock:
+                    records, self._pending = self._pending or [], None
+                if records:
+                    self._write_records(records)
+
+    def _write_records(self, records: list[dict]) -> None:
         if self._db_initialized:
             try:
                 with sqlite3.connect(self.sqlite_path) as connection:
-                    connection.execute(
+                    connection.executemany(
                         "INSERT INTO audit_log (timestamp, action, status, details, error) VALUES (?, ?, ?, ?, ?)",
-                        (
-                            record["timestamp"],
-                            record["action"],
-                            record["status"],
-                            json.dumps(record["details"], ensure_ascii=True),
-                            record["error"],
-                        ),
+                        [
+                            (
+                                record["timestamp"],
+                                record["action"],
+                                record["status"],
+                                json.dumps(record["details"], ensure_ascii=True),
+                                record["error"],
+                            )
+                            for record in records
+                        ],
                     )
                     connection.commit()
                 return
             except sqlite3.Error:
                 self._db_initialized = False
 
-        self._write_jsonl(record)
+        self._write_jsonl(*records)
 
     def log_review(self, action: str, details: dict | None = None, error: str | None = None) -> None:
         self.log(action=action, status="review", details=details, error=error)
@@ -118,7 +153,14 @@ class AuditLogger:
     def has_run_id(self, run_id: str) -> bool:
         if not self.enabled:
             return False
-
+        if run_id in self._known_run_ids:
+            return True
+        found = self._lookup_run_id(run_id)
+        if found:
+            self._known_run_ids.add(run_id)
+        return found
+
+    def _lookup_run_id(self, run_id: str) -> bool:
         if self._db_initialized:
             try:
                 with sqlite3.connect(self.sqlite_path) as connection:
@@ -144,20 +186,21 @@ class AuditLogger:
                 with sqlite3.connect(self.sqlite_path) as connection:
                     connection.execute(
                         "INSERT OR IGNORE INTO run_registry (run_id, project, created_at, status) VALUES (?, ?, ?, ?)",
-                        (run_id, project, _utc_now_iso(), status),
+                        (run_id, project, utc_now_iso(), status),
                     )
                     connection.commit()
             except sqlite3.Error:
                 self._db_initialized = False
 
+        self._known_run_ids.add(run_id)
         self.log(action="run_registry", status=status, details=payload)
 
-    def _write_jsonl(self, record: dict) -> None:
+    def _write_jsonl(self, *records: dict) -> None:
         directory = os.path.dirname(self.jsonl_path)
         if directory:
             os.makedirs(directory, exist_ok=True)
         with open(self.jsonl_path, "a") as handle:
-            handle.write(json.dumps(record, ensure_ascii=True) + "\n")
+            handle.writelines(json.dumps(record, ensure_ascii=True) + "\n" for record in records)
 
     def _run_id_in_jsonl(self, run_id: str) -> bool:
         if not os.path.exists(self.jsonl_path):
@@ -203,7 +246,7 @@ class AuditLogger:
             with sqlite3.connect(self.sqlite_path) as connection:
                 connection.execute(
                     "INSERT OR REPLACE INTO users (user_id, real_name, display_name, updated_at) VALUES (?, ?, ?, ?)",
-                    (user_id, real_name, display_name, _utc_now_iso()),
+                    (user_id, real_name, display_name, utc_now_iso()),
                 )
                 connection.commit()
         except sqlite3.Error:
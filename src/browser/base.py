@@ -543,6 +543,9 @@ class BrowserSession:
 class BaseBrowserClient:
     """Base class for browser-based clients to consolidate common logic."""
 
+    # Lets callers detect the browser fallback without importing this package.
+    is_browser_fallback = True
+
     def __init__(self, session: BrowserSession, config: BrowserAutomationConfig):
         self.session = session
         self.config = config
@@ -3,8 +3,10 @@ from __future__ import annotations
 import json
 import logging
 import os
+import random
 import re
 import time
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any, cast
 from urllib.parse import urlencode, urljoin
@@ -30,6 +32,22 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Fallback backoff for 429s that carry no Retry-After header.
+_RATE_LIMIT_BACKOFF_BASE_S = 0.5
+_RATE_LIMIT_BACKOFF_MAX_S = 30.0
+_RATE_LIMIT_JITTER_S = 0.25
+
+# Reads a search result's text, first link and timestamp attributes in one evaluate call.
+_SEARCH_RESULT_FIELDS_JS = """(el) => {
+    const link = el.querySelector("a[href]");
+    const stamp = el.querySelector("a[data-ts], time");
+    return {
+        text: el.innerText || "",
+        href: link ? link.getAttribute("href") || "" : "",
+        ts: stamp ? stamp.getAttribute("data-ts") || stamp.getAttribute("datetime") || "" : "",
+    };
+}"""
+
 
 class SlackBrowserClient(BaseBrowserClient):
     def __init__(self, session: BrowserSession, config: BrowserAutomationConfig):
@@ -270,7 +288,7 @@ class SlackBrowserClient(BaseBrowserClient):
         self,
         page,
         extractor: DOMExtractor,
-        selector_set: list[str],
+        selector_set: Sequence[str],
         messages: list[dict[str, Any]],
         seen: set[str],
         channel_id: str,
@@ -321,7 +339,7 @@ class SlackBrowserClient(BaseBrowserClient):
                 added += 1
         return added
 
-    def _find_first_visible_locator(self, page, selectors: list[str], timeout: int = 1500):
+    def _find_first_visible_locator(self, page, selectors: Sequence[str], timeout: int = 1500):
         for selector in selectors:
             try:
                 locator = page.locator(selector).first
@@ -555,25 +573,18 @@ class SlackBrowserClient(BaseBrowserClient):
 
             def collect() -> int:
                 added = 0
-                for selector in MESSAGE_CONTAINER.get_all():
-                    try:
-                        for element in page.locator(selector).all():
-                            data = extractor.extract_message_data(element)
-                            if not data:
-                                continue
-                            api_message = self._build_api_like_message(data, channel_id=channel_id, page_url=page.url)
-                            if not api_message:
-                                continue
-                            if not self._passes_time_window(api_message.get("ts"), oldest=oldest, latest=latest):
-                                continue
-                            key = api_message.get("ts") or f"{api_message.get('user')}::{api_message.get('text')}"
-                            if key in seen:
-                                continue
-                            seen.add(key)
-                            messages.append(api_message)
-                            added += 1
-                    except Exception:
+                for data in extractor.extract_all_messages(MESSAGE_CONTAINER):
+                    api_message = self._build_api_like_message(data, channel_id=channel_id, page_url=page.url)
+                    if not api_message:
+                        continue
+                    if not self._passes_time_window(api_message.get("ts"), oldest=oldest, latest=latest):
+                        continue
+                    key = api_message.get("ts") or f"{api_message.get('user')}::{api_message.get('text')}"
+                    if key in seen:
                         continue
+                    seen.add(key)
+                    messages.append(api_message)
+                    added += 1
                 return added
 
             collect()
@@ -614,27 +625,14 @@ class SlackBrowserClient(BaseBrowserClient):
 
     def _extract_search_result_data(self, element, page) -> dict[str, Any] | None:
         try:
-            text = element.inner_text().strip()
+            fields = element.evaluate(_SEARCH_RESULT_FIELDS_JS)
         except Exception:
-            text = ""
+            fields = {}
 
-        permalink = ""
-        ts = ""
-        try:
-            link = element.locator("a[href]").first
-            if link.count() > 0:
-                href = link.get_attribute("href") or ""
-                if href:
-                    permalink = href if href.startswith("http") else urljoin(page.url, href)
-        except Exception:
-            pass
-
-        try:
-            ts_el = element.locator("a[data-ts], time").first
-            if ts_el.count() > 0:
-                ts = ts_el.get_attribute("data-ts") or ts_el.get_attribute("datetime") or ""
-        except Exception:
-            pass
+        text = str(fields.get("text") or "").strip()
+        href = str(fields.get("href") or "")
+        permalink = (href if href.startswith("http") else urljoin(page.url, href)) if href else ""
+        ts = str(fields.get("ts") or "")
 
         if not ts and permalink:
             ts = self._parse_ts_from_permalink(permalink) or ""
@@ -754,9 +752,11 @@ class SlackBrowserClient(BaseBrowserClient):
                 if status == 429:
                     retry_after = response.headers.get("retry-after")
                     try:
-                        sleep_s = float(retry_after) if retry_after else 1.0
-                    except Exception:
-                        sleep_s = 1.0
+                        sleep_s = float(retry_after)
+                    except (TypeError, ValueError):
+                        sleep_s = min(
+                            _RATE_LIMIT_BACKOFF_MAX_S, _RATE_LIMIT_BACKOFF_BASE_S * 2**attempt
+                        ) + random.uniform(0, _RATE_LIMIT_JITTER_S)
                     self.stats["rate_limit_hits"] += 1
                     self.stats["rate_limit_sleep_s"] += sleep_s
                     if attempt < max_attempts - 1:
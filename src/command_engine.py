@@ -47,7 +47,7 @@ class CommandEngine:
             self.engine.browser_session.start()
 
             # Check if we are headless
-            if self.engine.browser_config.headless:
+            if self.engine.browser_session.config.headless:
                 return (
                     "I'm currently running in headless mode (invisible). "
                     "Please check config.json and set 'headless': false to use this feature."
@@ -1,8 +1,14 @@
+import functools
 import json
 import os
 import re
 from typing import Any, cast
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads  # type: ignore[assignment]
+
 DEFAULT_CONFIG = {
     "settings": {
         "slack": {
@@ -81,6 +87,7 @@ DEFAULT_CONFIG = {
             "notion_audit_page_id": "",
             "notion_last_synced_page_id": "",
             "notion_last_synced_property": "Last Synced",
+            "strict_verify": False,
         },
     },
     "projects": [],
@@ -90,6 +97,8 @@ ENV_VAR_PATTERN = re.compile(r"^\$\{([A-Za-z_][A-Za-z0-9_]*)\}$")
 NOTION_ID_RE = re.compile(r"[0-9a-fA-F]{32}")
 NOTION_ID_DASHED_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
 
+_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 def _resolve_env_placeholder(value: str) -> str:
     stripped = value.strip()
@@ -140,23 +149,34 @@ def _normalize_notion_ids(value: Any, key: str | None = None) -> Any:
 
 
 def _deep_merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
+    # Exact type checks: merged values come from JSON, so they are plain dicts or leaves.
     for key, value in overrides.items():
-        if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-            _deep_merge(base[key], value)
+        existing = base.get(key)
+        if type(value) is dict and type(existing) is dict:
+            _deep_merge(existing, value)
         else:
             base[key] = value
     return base
 
 
+@functools.lru_cache(maxsize=8)
+def _read_user_config(full_path: str, mtime_ns: int) -> dict[str, Any]:
+    # Keyed on mtime so edits to the file are picked up; callers must not mutate the result.
+    with open(full_path, "rb") as handle:
+        raw = handle.read()
+    return cast(dict[str, Any], _loads(raw))
+
+
 def load_config(config_path: str) -> dict[str, Any]:
-    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    full_path = os.path.join(base_path, config_path)
+    full_path = os.path.join(_BASE_PATH, config_path)
     config = cast(dict[str, Any], json.loads(json.dumps(DEFAULT_CONFIG)))
 
-    if os.path.exists(full_path):
-        with open(full_path, "r") as handle:
-            user_config = cast(dict[str, Any], json.load(handle))
-        _deep_merge(config, user_config)
+    try:
+        mtime_ns = os.stat(full_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None:
+        _deep_merge(config, _read_user_config(full_path, mtime_ns))
 
     resolved = _resolve_env_in_config(config)
     normalized = _normalize_notion_ids(resolved)
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import logging
-from dataclasses import dataclass, field
+import os
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
+from .config_validation import validate_daily_report_config
+
 logger = logging.getLogger(__name__)
 
 
@@ -90,6 +96,30 @@ class DailyReportConfig:
     notion: NotionConfig = field(default_factory=NotionConfig)
 
 
+# Nested sections of DailyReportConfig and the dataclass each one parses into.
+_SECTION_TYPES: tuple[tuple[str, type], ...] = (
+    ("output", OutputConfig),
+    ("filtering", FilteringConfig),
+    ("cache", CacheConfig),
+    ("browser_automation", BrowserAutomationConfig),
+    ("historical_tracking", HistoricalTrackingConfig),
+    ("notion", NotionConfig),
+)
+
+# (section name, field names) pairs serialized by ConfigManager.save(), derived
+# from the dataclasses so the on-disk layout cannot drift from the schema.
+_SAVE_SECTIONS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (name, tuple(f.name for f in fields(cls))) for name, cls in _SECTION_TYPES
+)
+
+_LIST_FIELDS = ("channels", "project_channels", "team_members")
+
+
+def _split_csv(value: str) -> list[str]:
+    """Split a comma-separated CLI value into interned, non-empty items."""
+    return [sys.intern(item.strip()) for item in value.split(",") if item.strip()]
+
+
 class ConfigManager:
     """Manage configuration loading and access."""
 
@@ -113,26 +143,24 @@ class ConfigManager:
         try:
             with open(path, "r", encoding="utf-8") as f:
                 data = json.load(f)
+            errors = validate_daily_report_config(data)
+            if errors:
+                raise ValueError("; ".join(errors))
             self._config = self._parse_config(data)
             return self._config
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Warning: Failed to load config from {path}: {e}")
             self._config = DailyReportConfig()
             return self._config
 
     def _parse_config(self, data: dict[str, Any]) -> DailyReportConfig:
         """Parse configuration dictionary into dataclasses."""
-        return DailyReportConfig(
-            channels=data.get("channels", []),
-            project_channels=data.get("project_channels", []),
-            team_members=data.get("team_members", []),
-            output=OutputConfig(**data.get("output", {})),
-            filtering=FilteringConfig(**data.get("filtering", {})),
-            cache=CacheConfig(**data.get("cache", {})),
-            browser_automation=BrowserAutomationConfig(**data.get("browser_automation", {})),
-            historical_tracking=HistoricalTrackingConfig(**data.get("historical_tracking", {})),
-            notion=NotionConfig(**data.get("notion", {})),
-        )
+        kwargs: dict[str, Any] = {name: data.get(name) or [] for name in _LIST_FIELDS}
+        for (name, cls), (_, field_names) in zip(_SECTION_TYPES, _SAVE_SECTIONS):
+            sub = data.get(name)
+            # Unknown keys (comments, fields from newer versions) are ignored rather than rejected.
+            kwargs[name] = cls(**{key: value for key, value in sub.items() if key in field_names}) if sub else cls()
+        return DailyReportConfig(**kwargs)
 
     def save(self, config: DailyReportConfig | None = None) -> None:
         """Save configuration to file."""
@@ -142,51 +170,14 @@ class ConfigManager:
         path = Path(self.config_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
+        data: dict[str, Any] = {
             "channels": config.channels,
             "project_channels": config.project_channels,
             "team_members": config.team_members,
-            "output": {
-                "directory": config.output.directory,
-                "formats": config.output.formats,
-                "default_format": config.output.default_format,
-                "group_by": config.output.group_by,
-            },
-            "filtering": {
-                "actionable_only": config.filtering.actionable_only,
-                "include_mentions_search": config.filtering.include_mentions_search,
-                "min_text_length": config.filtering.min_text_length,
-                "exclude_patterns": config.filtering.exclude_patterns,
-            },
-            "cache": {
-                "enabled": config.cache.enabled,
-                "directory": config.cache.directory,
-                "ttl_seconds": config.cache.ttl_seconds,
-            },
-            "browser_automation": {
-                "enabled": config.browser_automation.enabled,
-                "headless": config.browser_automation.headless,
-                "slow_mo_ms": config.browser_automation.slow_mo_ms,
-                "timeout_ms": config.browser_automation.timeout_ms,
-                "max_retries": config.browser_automation.max_retries,
-                "retry_delay_ms": config.browser_automation.retry_delay_ms,
-                "storage_state_path": config.browser_automation.storage_state_path,
-                "slack_workspace_id": config.browser_automation.slack_workspace_id,
-                "slack_client_url": config.browser_automation.slack_client_url,
-                "slack_api_base_url": config.browser_automation.slack_api_base_url,
-            },
-            "historical_tracking": {
-                "enabled": config.historical_tracking.enabled,
-                "snapshots_directory": config.historical_tracking.snapshots_directory,
-                "compare_with_previous": config.historical_tracking.compare_with_previous,
-            },
-            "notion": {
-                "enabled": config.notion.enabled,
-                "sync_tasks": config.notion.sync_tasks,
-                "database_id": config.notion.database_id,
-                "base_url": config.notion.base_url,
-            },
         }
+        for section, field_names in _SAVE_SECTIONS:
+            sub = getattr(config, section)
+            data[section] = {name: getattr(sub, name) for name in field_names}
 
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
@@ -197,16 +188,20 @@ class ConfigManager:
         return config.channels + config.project_channels
 
     def merge_with_args(self, args: Any) -> DailyReportConfig:
-        """Merge configuration with command-line arguments."""
-        config = self.load()
+        """Return a copy of the configuration with command-line arguments applied.
+
+        The loaded configuration is left untouched, since managers from
+        get_config_manager() are shared across callers.
+        """
+        config = copy.deepcopy(self.load())
 
         # Override with command-line args if provided
         if hasattr(args, "channels") and args.channels:
-            config.channels = args.channels.split(",")
+            config.channels = _split_csv(args.channels)
         if hasattr(args, "project_channels") and args.project_channels:
-            config.project_channels = args.project_channels.split(",")
+            config.project_channels = _split_csv(args.project_channels)
         if hasattr(args, "team_members") and args.team_members:
-            config.team_members = args.team_members.split(",")
+            config.team_members = _split_csv(args.team_members)
         if hasattr(args, "actionable_only") and args.actionable_only:
             config.filtering.actionable_only = True
         if hasattr(args, "include_mentions_search") and args.include_mentions_search:
@@ -221,6 +216,18 @@ class ConfigManager:
         return config
 
 
+def get_config_manager(config_path: str | None = None) -> ConfigManager:
+    """Return a process-wide ConfigManager for ``config_path``, loading it once."""
+    return _cached_config_manager(os.path.normpath(config_path or ConfigManager.DEFAULT_CONFIG_PATH))
+
+
+@functools.cache
+def _cached_config_manager(config_path: str) -> ConfigManager:
+    manager = ConfigManager(config_path)
+    manager.load()
+    return manager
+
+
 def get_default_config() -> DailyReportConfig:
     """Get default configuration."""
     return DailyReportConfig(
@@ -1,22 +1,38 @@
+import functools
 import re
-from typing import Any
+from collections import Counter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
-from jsonschema import Draft7Validator
+from .utils import coerce_bool
 
-SLACK_CHANNEL_RE = re.compile(r"^[CG][A-Z0-9]{8,}$")
-NOTION_ID_RE = re.compile(r"^[0-9a-fA-F]{32}$")
-NOTION_ID_DASHED_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
-NOTION_ID_IN_TEXT_RE = re.compile(r"[0-9a-fA-F]{32}")
-NOTION_ID_DASHED_IN_TEXT_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+_SLACK_CHANNEL_PATTERN = r"^[CG][A-Z0-9]{8,}$"
+SLACK_CHANNEL_RE = re.compile(_SLACK_CHANNEL_PATTERN)
+NOTION_ID_RE = re.compile(r"[0-9a-fA-F]{32}")
+NOTION_ID_DASHED_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+_SLACK_CHANNEL_MATCH = SLACK_CHANNEL_RE.match
+_NOTION_ID_SEARCH = NOTION_ID_RE.search
+_NOTION_ID_DASHED_SEARCH = NOTION_ID_DASHED_RE.search
 
-FEATURE_DEFAULTS = {
-    "enable_notion_audit_note": True,
-    "enable_notion_last_synced": True,
-    "enable_slack_topic_update": True,
-    "enable_audit": True,
-    "enable_run_id_idempotency": True,
-}
+
+FEATURE_DEFAULTS: Mapping[str, bool] = MappingProxyType(
+    {
+        "enable_notion_audit_note": True,
+        "enable_notion_last_synced": True,
+        "enable_slack_topic_update": True,
+        "enable_audit": True,
+        "enable_run_id_idempotency": True,
+    }
+)
 
 
 def _int_schema(minimum: int = 0) -> dict[str, Any]:
@@ -39,6 +55,9 @@ PAGINATION_SCHEMA: dict[str, Any] = {
 }
 
 
+_PAGINATION_KEYS = tuple(PAGINATION_SCHEMA["properties"])
+
+
 RETRY_SCHEMA: dict[str, Any] = {
     "type": "object",
     "additionalProperties": False,
@@ -62,7 +81,7 @@ PROJECT_SCHEMA: dict[str, Any] = {
     "additionalProperties": False,
     "properties": {
         "name": {"type": "string", "minLength": 1},
-        "slack_channel_id": {"type": "string", "pattern": r"^[CG][A-Z0-9]{8,}$"},
+        "slack_channel_id": {"type": "string", "pattern": _SLACK_CHANNEL_PATTERN},
         "notion_audit_page_id": {"type": "string"},
         "notion_audit_page_url": {"type": "string"},
         "notion_last_synced_page_id": {"type": "string"},
@@ -142,6 +161,7 @@ CONFIG_SCHEMA: dict[str, Any] = {
                         "notion_tickets_database_id": {"type": "string"},
                         "notion_builds_database_id": {"type": "string"},
                         "notion_last_synced_property": {"type": "string"},
+                        "strict_verify": {"type": "boolean"},
                     },
                 },
                 "browser_automation": {
@@ -328,59 +348,183 @@ TEAM_CHANNELS_SCHEMA: dict[str, Any] = {
 }
 
 
-def _coerce_bool(value: Any, default: bool) -> bool:
-    if value is None:
-        return default
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        return value.lower() in {"true", "1", "yes", "y"}
-    return bool(value)
+def _section_schema(properties: dict[str, Any]) -> dict[str, Any]:
+    # Unknown keys are ignored on load (ConfigManager drops them), so only known keys are typed.
+    return {"type": "object", "properties": properties}
+
 
+_STRING_LIST_SCHEMA: dict[str, Any] = {"type": "array", "items": {"type": "string"}}
 
-def _effective_feature(settings: dict, project: dict, key: str) -> bool:
-    settings_features = settings.get("features", {}) if isinstance(settings, dict) else {}
-    project_value = project.get(key) if isinstance(project, dict) else None
-    if project_value is None:
-        return _coerce_bool(settings_features.get(key), FEATURE_DEFAULTS[key])
-    return _coerce_bool(project_value, FEATURE_DEFAULTS[key])
+
+DAILY_REPORT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "channels": _STRING_LIST_SCHEMA,
+        "project_channels": _STRING_LIST_SCHEMA,
+        "team_members": _STRING_LIST_SCHEMA,
+        "output": _section_schema(
+            {
+                "directory": {"type": "string"},
+                "formats": _STRING_LIST_SCHEMA,
+                "default_format": {"type": "string"},
+                "group_by": {"type": "string"},
+            }
+        ),
+        "filtering": _section_schema(
+            {
+                "actionable_only": {"type": "boolean"},
+                "include_mentions_search": {"type": "boolean"},
+                "min_text_length": _int_schema(0),
+                "exclude_patterns": _STRING_LIST_SCHEMA,
+            }
+        ),
+        "cache": _section_schema(
+            {
+                "enabled": {"type": "boolean"},
+                "directory": {"type": "string"},
+                "ttl_seconds": _int_schema(0),
+            }
+        ),
+        "browser_automation": _section_schema(
+            {
+                "enabled": {"type": "boolean"},
+                "headless": {"type": "boolean"},
+                "slow_mo_ms": _int_schema(0),
+                "timeout_ms": _int_schema(1),
+                "max_retries": _int_schema(1),
+                "retry_delay_ms": _int_schema(0),
+                "storage_state_path": {"type": "string"},
+                "slack_workspace_id": {"type": "string"},
+                "slack_client_url": {"type": "string", "minLength": 1},
+                "slack_api_base_url": {"type": "string", "minLength": 1},
+            }
+        ),
+        "historical_tracking": _section_schema(
+            {
+                "enabled": {"type": "boolean"},
+                "snapshots_directory": {"type": "string"},
+                "compare_with_previous": {"type": "boolean"},
+            }
+        ),
+        "notion": _section_schema(
+            {
+                "enabled": {"type": "boolean"},
+                "sync_tasks": {"type": "boolean"},
+                "database_id": {"type": "string"},
+                "base_url": {"type": "string"},
+            }
+        ),
+    },
+}
+
+
+# Schemas by name; the name doubles as the error-message prefix. The shared
+# PAGINATION_SCHEMA/RETRY_SCHEMA subtrees are inline, so there are no $refs to
+# resolve. Validators are built and memoized on first use rather than at import,
+# keeping the meta-schema check (and fastjsonschema code generation, when that
+# package is installed) off the import path of every module that pulls this in.
+# The generated checker answers the common "is it valid?" case; Draft7Validator
+# is only walked to collect the full error list for invalid payloads.
+_SCHEMAS: dict[str, dict[str, Any]] = {
+    "config": CONFIG_SCHEMA,
+    "team_channels": TEAM_CHANNELS_SCHEMA,
+    "daily_report": DAILY_REPORT_SCHEMA,
+}
+
+
+@functools.cache
+def _compiled_schema(name: str) -> tuple["Draft7Validator", Callable[[Any], Any] | None]:
+    # jsonschema takes ~80ms to import; defer it until something is validated.
+    from jsonschema import Draft7Validator
+
+    schema = _SCHEMAS[name]
+    Draft7Validator.check_schema(schema)
+    fast_check = fastjsonschema.compile(schema) if fastjsonschema is not None else None
+    return Draft7Validator(schema), fast_check
+
+
+def _effective_feature(settings_features: dict, project: dict, key: str) -> bool:
+    value = project.get(key)
+    if value is None:
+        value = settings_features.get(key)
+    return coerce_bool(value, FEATURE_DEFAULTS[key])
 
 
 def _validate_notion_id(value: str) -> bool:
     return _extract_notion_page_id(value) is not None
 
 
+@functools.lru_cache(maxsize=2048)
 def _extract_notion_page_id(value: str) -> str | None:
-    if NOTION_ID_RE.match(value):
-        return value
-    if NOTION_ID_DASHED_RE.match(value):
-        return value.replace("-", "")
-    dashed = NOTION_ID_DASHED_IN_TEXT_RE.search(value)
+    # A dashed ID anywhere in the value wins over an undashed one, as in config_loader._extract_notion_id.
+    dashed = _NOTION_ID_DASHED_SEARCH(value)
     if dashed:
         return dashed.group(0).replace("-", "")
-    raw = NOTION_ID_IN_TEXT_RE.search(value)
+    raw = _NOTION_ID_SEARCH(value)
     if raw:
         return raw.group(0)
     return None
 
 
-def _schema_errors(schema: dict[str, Any], payload: Any, prefix: str) -> list[str]:
-    validator = Draft7Validator(schema)
-    errors: list[str] = []
-    for error in sorted(validator.iter_errors(payload), key=lambda e: list(e.absolute_path)):
-        path = ".".join(str(part) for part in error.absolute_path) or "(root)"
-        errors.append(f"{prefix} schema at {path}: {error.message}")
-    return errors
+def _passes_fast_check(name: str, payload: Any) -> bool:
+    fast_check = _compiled_schema(name)[1]
+    if fast_check is None:
+        return False
+    try:
+        fast_check(payload)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
+
+
+def _format_schema_error(name: str, error: Any) -> str:
+    path = ".".join(str(part) for part in error.absolute_path) or "(root)"
+    return f"{name} schema at {path}: {error.message}"
+
+
+def _schema_errors(name: str, payload: Any) -> list[str]:
+    if _passes_fast_check(name, payload):
+        return []
+    validator = _compiled_schema(name)[0]
+    errors = sorted(validator.iter_errors(payload), key=lambda e: list(e.absolute_path))
+    return [_format_schema_error(name, error) for error in errors]
+
+
+def _schema_first_error(name: str, payload: Any) -> str | None:
+    if _passes_fast_check(name, payload):
+        return None
+    error = next(_compiled_schema(name)[0].iter_errors(payload), None)
+    return _format_schema_error(name, error) if error is not None else None
+
 
+def _as_dict(value: Any) -> dict:
+    return value if isinstance(value, dict) else {}
 
-def validate_config(config: dict) -> list[str]:
+
+def _schema_enabled(settings: dict) -> bool:
+    return coerce_bool(settings.get("validate_config_on_startup"), True)
+
+
+def validate_config(config: Any, schema: bool | None = None) -> list[str]:
+    """Return validation errors for a config.json payload.
+
+    ``schema`` controls the JSON Schema pass. When left as ``None`` it follows
+    ``settings.validate_config_on_startup`` (default true); deployments that opt
+    out skip the schema walk and only get the business-rule checks below.
+    """
     errors: list[str] = []
 
-    errors.extend(_schema_errors(CONFIG_SCHEMA, config, "config"))
+    settings = _as_dict(config.get("settings")) if isinstance(config, dict) else {}
+    if schema is None:
+        schema = _schema_enabled(settings)
+    if schema:
+        errors.extend(_schema_errors("config", config))
+    if not isinstance(config, dict):
+        return errors
 
-    settings = config.get("settings", {}) if isinstance(config, dict) else {}
-    audit_settings = settings.get("audit", {}) if isinstance(settings, dict) else {}
-    browser_settings = settings.get("browser_automation", {}) if isinstance(settings, dict) else {}
+    audit_settings = _as_dict(settings.get("audit"))
+    browser_settings = _as_dict(settings.get("browser_automation"))
+    settings_features = _as_dict(settings.get("features"))
 
     if browser_settings.get("enabled", False):
         storage_state_path = browser_settings.get("storage_state_path")
@@ -397,30 +541,33 @@ def validate_config(config: dict) -> list[str]:
         if "event_log_path" in browser_settings and not browser_settings.get("event_log_path"):
             errors.append("settings.browser_automation.event_log_path cannot be empty")
 
-    projects = config.get("projects", []) if isinstance(config, dict) else []
-    project_names = [name for p in projects if isinstance(p, dict) for name in [p.get("name")] if isinstance(name, str)]
-    duplicates = {n for n in project_names if project_names.count(n) > 1}
-    for dup in sorted(duplicates):
+    projects = [p for p in config.get("projects", []) if isinstance(p, dict)]
+    name_counts = Counter(name for p in projects if isinstance(name := p.get("name"), str))
+    duplicates = sorted(n for n, count in name_counts.items() if count > 1)
+    for dup in duplicates:
         errors.append(f"project.name must be unique: {dup}")
 
+    # Workspace-level fallbacks shared by every project that leaves them blank.
+    default_audit_page = audit_settings.get("notion_audit_page_id")
+    default_last_synced_page = audit_settings.get("notion_last_synced_page_id")
+    last_synced_property = audit_settings.get("notion_last_synced_property")
+
     for project in projects:
-        if not isinstance(project, dict):
-            continue
         name = project.get("name") or "(unknown)"
         channel_id = project.get("slack_channel_id")
-        if channel_id and not SLACK_CHANNEL_RE.match(channel_id):
+        if channel_id and not _SLACK_CHANNEL_MATCH(channel_id):
             errors.append(f"project '{name}' has invalid slack_channel_id: {channel_id}")
 
-        enable_audit = _effective_feature(settings, project, "enable_audit")
-        enable_idempotency = _effective_feature(settings, project, "enable_run_id_idempotency")
+        enable_audit = _effective_feature(settings_features, project, "enable_audit")
+        enable_idempotency = _effective_feature(settings_features, project, "enable_run_id_idempotency")
         if enable_idempotency and not enable_audit:
             errors.append(f"project '{name}' enables run-id idempotency but audit is disabled")
 
-        enable_audit_note = _effective_feature(settings, project, "enable_notion_audit_note")
-        enable_last_synced = _effective_feature(settings, project, "enable_notion_last_synced")
+        enable_audit_note = _effective_feature(settings_features, project, "enable_notion_audit_note")
+        enable_last_synced = _effective_feature(settings_features, project, "enable_notion_last_synced")
 
-        audit_page = project.get("notion_audit_page_id") or audit_settings.get("notion_audit_page_id")
-        last_synced_page = project.get("notion_last_synced_page_id") or audit_settings.get("notion_last_synced_page_id")
+        audit_page = project.get("notion_audit_page_id") or default_audit_page
+        last_synced_page = project.get("notion_last_synced_page_id") or default_last_synced_page
 
         if enable_audit_note:
             if not audit_page:
@@ -434,32 +581,34 @@ def validate_config(config: dict) -> list[str]:
             elif not _validate_notion_id(last_synced_page):
                 errors.append(f"project '{name}' has invalid notion_last_synced_page_id: {last_synced_page}")
 
-            property_name = audit_settings.get("notion_last_synced_property")
-            if not property_name:
+            if not last_synced_property:
                 errors.append("settings.audit.notion_last_synced_property is required when last synced is enabled")
 
         notion_page_url = project.get("notion_page_url")
         if notion_page_url and not _extract_notion_page_id(notion_page_url):
             errors.append(f"project '{name}' has invalid notion_page_url")
 
+        # PAGINATION_SCHEMA already enforces positive integers; only re-check
+        # by hand when the schema pass was skipped.
         pagination = project.get("slack_pagination", {})
-        if isinstance(pagination, dict):
-            for key in ["history_limit", "history_max_pages", "search_limit", "search_max_pages"]:
-                if key in pagination:
-                    try:
-                        value = int(pagination[key])
-                    except (TypeError, ValueError):
-                        errors.append(f"project '{name}' has invalid slack_pagination.{key}")
-                        continue
-                    if value <= 0:
-                        errors.append(f"project '{name}' slack_pagination.{key} must be > 0")
+        if not schema and isinstance(pagination, dict):
+            for key in _PAGINATION_KEYS:
+                if key not in pagination:
+                    continue
+                try:
+                    value = int(pagination[key])
+                except (TypeError, ValueError):
+                    errors.append(f"project '{name}' has invalid slack_pagination.{key}")
+                    continue
+                if value <= 0:
+                    errors.append(f"project '{name}' slack_pagination.{key} must be > 0")
 
     return errors
 
 
 def validate_team_channels_config(config: Any) -> list[str]:
     errors: list[str] = []
-    errors.extend(_schema_errors(TEAM_CHANNELS_SCHEMA, config, "team_channels"))
+    errors.extend(_schema_errors("team_channels", config))
 
     if not isinstance(config, dict):
         return errors
@@ -497,8 +646,20 @@ def validate_team_channels_config(config: Any) -> list[str]:
     return errors
 
 
-def validate_or_raise(config: dict) -> None:
-    errors = validate_config(config)
+def validate_daily_report_config(config: Any) -> list[str]:
+    return _schema_errors("daily_report", config)
+
+
+def validate_or_raise(config: dict, schema: bool | None = None) -> None:
+    if schema is None:
+        schema = _schema_enabled(_as_dict(config.get("settings")) if isinstance(config, dict) else {})
+    if schema:
+        # Raising anyway, so stop at the first schema violation instead of
+        # enumerating the whole tree.
+        first_error = _schema_first_error("config", config)
+        if first_error is not None:
+            raise RuntimeError(f"Config validation failed:\n{first_error}")
+    errors = validate_config(config, schema=False)
     if errors:
         error_text = "\n".join(errors)
         raise RuntimeError(f"Config validation failed:\n{error_text}")
@@ -25,15 +25,33 @@ Usage:
     print(aggregator.format_daily_report("Francisco Oliveira"))
 """
 
+import copy
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, cast
 
-from .channel_manager import ChannelManager
-from .task_memory import TaskMemory, TaskStatus
+from .channel_manager import ChannelInfo, ChannelManager, ChecklistItem
+from .task_memory import TaskMemory, TaskRecord, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Status strings compared in per-task loops, resolved from the enum once.
+_STATUS_COMPLETE = TaskStatus.COMPLETE.value
+_STATUS_IN_PROGRESS = TaskStatus.IN_PROGRESS.value
+
+# Sections get_daily_summary can compute; omitted ones are returned empty.
+SUMMARY_SECTIONS: FrozenSet[str] = frozenset({"tasks", "standup", "channels", "discrepancies"})
+_OVERVIEW_SECTIONS: FrozenSet[str] = frozenset({"tasks", "standup"})
+
+# Shared formatting for the text reports.
+_HEADER_SEP = "=" * 60
+_SUBSEP = "-" * 60
+_ICON_DONE = "✅"
+_ICON_PENDING = "⏳"
+
 
 class DailyAggregator:
     """
@@ -44,26 +62,97 @@ class DailyAggregator:
     - ChannelManager: Channel priorities, patterns
     """
 
-    def __init__(self, task_memory: Optional[TaskMemory] = None, channel_manager: Optional[ChannelManager] = None):
+    DEFAULT_CACHE_TTL_SECONDS = 60.0
+    MAX_CACHE_ENTRIES = 256
+
+    def __init__(
+        self,
+        task_memory: Optional[TaskMemory] = None,
+        channel_manager: Optional[ChannelManager] = None,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+    ):
         """
         Initialize DailyAggregator.
 
         Args:
             task_memory: TaskMemory instance (creates new if not provided)
             channel_manager: ChannelManager instance (creates new if not provided)
+            cache_ttl_seconds: How long summaries and priority lists are reused (0 disables caching)
         """
         self.memory = task_memory or TaskMemory()
         self.channels = channel_manager or ChannelManager()
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # Entries are (stored_at, TaskMemory revision, value); a write to memory makes them stale.
+        self._summary_cache: OrderedDict[Tuple[str, str, FrozenSet[str]], Tuple[float, int, Dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._priority_cache: OrderedDict[Tuple[str, int, str], Tuple[float, int, List[Dict[str, Any]]]] = OrderedDict()
+
+    # ==================== Caching ====================
+
+    def _cache_get(self, cache: OrderedDict[Any, Tuple[float, int, Any]], key: Any) -> Any:
+        """Return a copy of a fresh cached value, or None on miss, expiry or a TaskMemory write."""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, revision, value = entry
+        if revision != self.memory.revision or time.monotonic() - stored_at >= self.cache_ttl_seconds:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def _cache_set(self, cache: OrderedDict[Any, Tuple[float, int, Any]], key: Any, value: Any) -> None:
+        """Store a copy of value so callers cannot mutate the cached entry.
+
+        The least recently used entry is evicted once MAX_CACHE_ENTRIES is exceeded.
+        """
+        if self.cache_ttl_seconds <= 0:
+            return
+        cache[key] = (time.monotonic(), self.memory.revision, copy.deepcopy(value))
+        cache.move_to_end(key)
+        if len(cache) > self.MAX_CACHE_ENTRIES:
+            cache.popitem(last=False)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        Drop cached summaries and priority lists.
+
+        Writes through TaskMemory are picked up automatically; call this after
+        changes it cannot see, such as edits to the channel configuration.
+
+        Args:
+            name: Only drop entries for this team member (all entries if omitted)
+        """
+        if name is None:
+            self._summary_cache.clear()
+            self._priority_cache.clear()
+            return
+        caches: Tuple[OrderedDict[Any, Tuple[float, int, Any]], ...] = (self._summary_cache, self._priority_cache)
+        for cache in caches:
+            for key in [k for k in cache if k[0] == name]:
+                del cache[key]
 
     # ==================== Daily Summaries ====================
 
-    def get_daily_summary(self, name: str, date: Optional[str] = None) -> Dict[str, Any]:
+    def get_daily_summary(
+        self,
+        name: str,
+        date: Optional[str] = None,
+        tasks: Optional[Dict[str, TaskRecord]] = None,
+        generated_at: Optional[str] = None,
+        include: FrozenSet[str] = SUMMARY_SECTIONS,
+    ) -> Dict[str, Any]:
         """
         Get comprehensive daily summary for a team member.
 
         Args:
             name: Team member name
             date: Date in YYYY-MM-DD format (defaults to today)
+            tasks: Pre-fetched {task_id: task} index for this member (fetched if omitted;
+                supplying it bypasses the cache)
+            generated_at: ISO timestamp to stamp on the summary (defaults to now)
+            include: Sections to compute, a subset of SUMMARY_SECTIONS (others are left empty)
 
         Returns:
             Dictionary with all relevant task information
@@ -71,34 +160,41 @@ class DailyAggregator:
         if not date:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        # Get task data from memory
-        task_data = self.memory.get_team_member_tasks(name, date, include_completed=True)
+        cache_key = (name, date, include)
+        use_cache = tasks is None
+        cached = self._cache_get(self._summary_cache, cache_key) if use_cache else None
+        if cached is not None:
+            return cast(Dict[str, Any], cached)
+
+        # Get discrepancies from memory
+        discrepancies: List[Any] = []
+        if "discrepancies" in include:
+            task_data = self.memory.get_team_member_tasks(name, date, include_completed=True)
+            discrepancies = task_data.get("discrepancies", [])
 
         # Get channel data
-        channel_checklist = self.channels.generate_daily_checklist(name)
-        priority_channels = self.channels.get_priority_channels(name, "high")
+        channel_checklist: List[ChecklistItem] = []
+        priority_channels: List[ChannelInfo] = []
+        if "channels" in include:
+            channel_checklist = self.channels.generate_daily_checklist(name)
+            priority_channels = self.channels.get_priority_channels(name, "high")
 
         # Get standup
-        standup = self.memory.get_standup(name, date)
-
-        # Categorize tasks
-        pending_tasks = []
-        in_progress_tasks = []
-        completed_tasks = []
-
-        for task in self.memory.get_tasks_by_assignee(name):
-            if task.status == TaskStatus.COMPLETE.value:
-                completed_tasks.append(task)
-            elif task.status == TaskStatus.IN_PROGRESS.value:
-                in_progress_tasks.append(task)
-            else:
-                pending_tasks.append(task)
+        standup = self.memory.get_standup(name, date) if "standup" in include else None
+
+        pending_tasks: List[Dict[str, Any]] = []
+        in_progress_tasks: List[Dict[str, Any]] = []
+        completed_tasks: List[Dict[str, Any]] = []
+        if "tasks" in include:
+            if tasks is None:
+                tasks = self._index_assignee_tasks(name)
+            pending_tasks, in_progress_tasks, completed_tasks = self._categorize_tasks(tasks)
 
         # Build summary
         summary = {
             "team_member": name,
             "date": date,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": generated_at or datetime.now().isoformat(),
             # Task counts
             "task_counts": {
                 "total": len(pending_tasks) + len(in_progress_tasks) + len(completed_tasks),
@@ -107,17 +203,9 @@ class DailyAggregator:
                 "completed": len(completed_tasks),
             },
             # Tasks by status
-            "pending_tasks": [
-                {"name": t.task_name, "source": t.source, "priority": t.priority, "due_date": t.due_date}
-                for t in pending_tasks
-            ],
-            "in_progress_tasks": [
-                {"name": t.task_name, "source": t.source, "priority": t.priority, "notes": t.notes}
-                for t in in_progress_tasks
-            ],
-            "completed_tasks": [
-                {"name": t.task_name, "confirmed_by": t.confirmed_by, "source": t.source} for t in completed_tasks
-            ],
+            "pending_tasks": pending_tasks,
+            "in_progress_tasks": in_progress_tasks,
+            "completed_tasks": completed_tasks,
             # Standup info
             "standup": {
                 "posted": standup is not None,
@@ -132,12 +220,16 @@ class DailyAggregator:
             # High priority channels
             "high_priority_channels": [ch.channel for ch in priority_channels],
             # Discrepancies
-            "discrepancies": task_data.get("discrepancies", []),
+            "discrepancies": discrepancies,
         }
 
+        if use_cache:
+            self._cache_set(self._summary_cache, cache_key, summary)
         return summary
 
-    def get_priority_tasks(self, name: str, limit: int = 5) -> List[Dict[str, Any]]:
+    def get_priority_tasks(
+        self, name: str, limit: int = 5, tasks: Optional[Dict[str, TaskRecord]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get top priority tasks for a team member.
 
@@ -150,51 +242,98 @@ class DailyAggregator:
         Args:
             name: Team member name
             limit: Maximum number of tasks to return
+            tasks: Pre-fetched {task_id: task} index for this member (fetched if omitted;
+                supplying it bypasses the cache)
 
         Returns:
             List of priority task dictionaries
         """
         today = datetime.now().strftime("%Y-%m-%d")
-        priority_tasks = []
-        seen_ids = set()
+        cache_key = (name, limit, today)
+        use_cache = tasks is None
+        cached = self._cache_get(self._priority_cache, cache_key) if use_cache else None
+        if cached is not None:
+            return cast(List[Dict[str, Any]], cached)
+
+        if tasks is None:
+            tasks = self._index_assignee_tasks(name)
+        pending_tasks, in_progress_tasks, _ = self._categorize_tasks(tasks)
+        priority_tasks = self._rank_priority_tasks(in_progress_tasks, pending_tasks, today, limit)
+        if use_cache:
+            self._cache_set(self._priority_cache, cache_key, priority_tasks)
+        return priority_tasks
+
+    def _index_assignee_tasks(self, name: str) -> Dict[str, TaskRecord]:
+        """Fetch a team member's tasks from TaskMemory once, keyed by task_id."""
+        return {task.task_id: task for task in self.memory.get_tasks_by_assignee(name)}
+
+    def _categorize_tasks(
+        self, tasks: Dict[str, TaskRecord]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split and serialize a team member's tasks in a single pass.
+
+        Anything not complete or in progress counts as pending.
 
-        # 1. In-progress tasks first
-        for task in self.memory.get_tasks_by_assignee(name, status=TaskStatus.IN_PROGRESS.value):
-            if task.task_id not in seen_ids:
-                priority_tasks.append(
+        Returns:
+            (pending, in-progress, completed) summary task dictionaries
+        """
+        pending_tasks: List[Dict[str, Any]] = []
+        in_progress_tasks: List[Dict[str, Any]] = []
+        completed_tasks: List[Dict[str, Any]] = []
+        for t in tasks.values():
+            if t.status == _STATUS_COMPLETE:
+                completed_tasks.append({"name": t.task_name, "confirmed_by": t.confirmed_by, "source": t.source})
+            elif t.status == _STATUS_IN_PROGRESS:
+                in_progress_tasks.append(
+                    {"name": t.task_name, "source": t.source, "priority": t.priority, "notes": t.notes}
+                )
+            else:
+                pending_tasks.append(
+                    {
+                        "name": t.task_name,
+                        "source": t.source,
+                        "priority": t.priority,
+                        "due_date": t.due_date,
+                        "status": t.status,
+                    }
+                )
+
+        return pending_tasks, in_progress_tasks, completed_tasks
+
+    @staticmethod
+    def _rank_priority_tasks(
+        in_progress_tasks: List[Dict[str, Any]], pending_tasks: List[Dict[str, Any]], today: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """Pick the top priorities from already-categorized summary task lists."""
+        priority_tasks = [
+            {
+                "name": task["name"],
+                "status": "in_progress",
+                "reason": "Currently working on",
+                "priority": task["priority"] or "medium",
+            }
+            for task in in_progress_tasks
+        ]
+        high_priority: List[Dict[str, Any]] = []
+        due_today: List[Dict[str, Any]] = []
+
+        for task in pending_tasks:
+            if task["priority"] == "high":
+                high_priority.append(
+                    {"name": task["name"], "status": task["status"], "reason": "High priority", "priority": "high"}
+                )
+            elif task["due_date"] == today:
+                due_today.append(
                     {
-                        "name": task.task_name,
-                        "status": "in_progress",
-                        "reason": "Currently working on",
-                        "priority": task.priority or "medium",
+                        "name": task["name"],
+                        "status": task["status"],
+                        "reason": "Due today",
+                        "priority": task["priority"] or "medium",
                     }
                 )
-                seen_ids.add(task.task_id)
-
-        # 2. High priority tasks
-        for task in self.memory.get_tasks_by_assignee(name):
-            if task.task_id not in seen_ids and task.priority == "high":
-                if task.status != TaskStatus.COMPLETE.value:
-                    priority_tasks.append(
-                        {"name": task.task_name, "status": task.status, "reason": "High priority", "priority": "high"}
-                    )
-                    seen_ids.add(task.task_id)
-
-        # 3. Tasks due today
-        for task in self.memory.get_tasks_by_assignee(name, date=today):
-            if task.task_id not in seen_ids:
-                if task.status != TaskStatus.COMPLETE.value:
-                    priority_tasks.append(
-                        {
-                            "name": task.task_name,
-                            "status": task.status,
-                            "reason": "Due today",
-                            "priority": task.priority or "medium",
-                        }
-                    )
-                    seen_ids.add(task.task_id)
-
-        return priority_tasks[:limit]
+
+        return (priority_tasks + high_priority + due_today)[:limit]
 
     # ==================== Team Overview ====================
 
@@ -208,32 +347,51 @@ class DailyAggregator:
         Returns:
             Dictionary with team-wide information
         """
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
         if not date:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = today
 
         team_members = self.channels.get_team_members()
-        overview: Dict[str, Any] = {
-            "date": date,
-            "generated_at": datetime.now().isoformat(),
-            "team_members": {},
-            "totals": {"pending": 0, "in_progress": 0, "completed": 0, "standups_posted": 0},
-        }
+        generated_at = now.isoformat()
+        member_overviews: Dict[str, Any] = {}
+        pending_total = in_progress_total = completed_total = standups_total = 0
 
+        grouped_tasks = self.memory.get_tasks_grouped_by_assignee(team_members)
         for name in team_members:
-            summary = self.get_daily_summary(name, date)
-            overview["team_members"][name] = {
-                "task_counts": summary["task_counts"],
-                "standup_posted": summary["standup"]["posted"],
-                "top_priorities": self.get_priority_tasks(name, limit=3),
+            tasks = {task.task_id: task for task in grouped_tasks[name]}
+            summary = self.get_daily_summary(
+                name, date, tasks=tasks, generated_at=generated_at, include=_OVERVIEW_SECTIONS
+            )
+            counts = summary["task_counts"]
+            standup_posted = summary["standup"]["posted"]
+            member_overviews[name] = {
+                "task_counts": counts,
+                "standup_posted": standup_posted,
+                # Ranked from the summary's lists rather than re-walking the tasks
+                "top_priorities": self._rank_priority_tasks(
+                    summary["in_progress_tasks"], summary["pending_tasks"], today, 3
+                ),
             }
 
             # Update totals
-            overview["totals"]["pending"] += summary["task_counts"]["pending"]
-            overview["totals"]["in_progress"] += summary["task_counts"]["in_progress"]
-            overview["totals"]["completed"] += summary["task_counts"]["completed"]
-            if summary["standup"]["posted"]:
-                overview["totals"]["standups_posted"] += 1
+            pending_total += counts["pending"]
+            in_progress_total += counts["in_progress"]
+            completed_total += counts["completed"]
+            if standup_posted:
+                standups_total += 1
 
+        overview: Dict[str, Any] = {
+            "date": date,
+            "generated_at": generated_at,
+            "team_members": member_overviews,
+            "totals": {
+                "pending": pending_total,
+                "in_progress": in_progress_total,
+                "completed": completed_total,
+                "standups_posted": standups_total,
+            },
+        }
         return overview
 
     # ==================== Formatted Reports ====================
@@ -253,10 +411,10 @@ class DailyAggregator:
         lines = []
 
         # Header
-        lines.append("=" * 60)
+        lines.append(_HEADER_SEP)
         lines.append(f"📋 Daily Task Report: {name}")
         lines.append(f"📅 Date: {summary['date']}")
-        lines.append("=" * 60)
+        lines.append(_HEADER_SEP)
 
         # Task counts
         counts = summary["task_counts"]
@@ -284,15 +442,16 @@ class DailyAggregator:
                 lines.append(f"   • {task['name']}{priority}")
 
         # Pending tasks
-        if summary["pending_tasks"]:
+        total_pending = len(summary["pending_tasks"])
+        if total_pending:
             lines.append("")
             lines.append("📌 Pending Tasks:")
-            for task in summary["pending_tasks"][:10]:  # Limit to 10
+            for task in islice(summary["pending_tasks"], 10):  # Limit to 10
                 priority = f" [{task['priority']}]" if task.get("priority") else ""
                 source = f" ({task['source']})" if task.get("source") else ""
                 lines.append(f"   • {task['name']}{priority}{source}")
-            if len(summary["pending_tasks"]) > 10:
-                lines.append(f"   ... and {len(summary['pending_tasks']) - 10} more")
+            if total_pending > 10:
+                lines.append(f"   ... and {total_pending - 10} more")
 
         # Completed tasks
         if summary["completed_tasks"]:
@@ -305,8 +464,8 @@ class DailyAggregator:
         # Channels to check
         lines.append("")
         lines.append("📺 Channels to Check:")
-        high_priority = [ch for ch in summary["channels_to_check"] if ch["priority"] == "high"]
-        for ch in high_priority[:5]:
+        high_priority = (ch for ch in summary["channels_to_check"] if ch["priority"] == "high")
+        for ch in islice(high_priority, 5):
             client = f" - {ch['client']}" if ch.get("client") else ""
             lines.append(f"   🔴 {ch['channel']}{client}")
 
@@ -314,11 +473,11 @@ class DailyAggregator:
         if summary["discrepancies"]:
             lines.append("")
             lines.append("⚠️ Discrepancies Found:")
-            for disc in summary["discrepancies"][:3]:
+            for disc in islice(summary["discrepancies"], 3):
                 lines.append(f"   • {disc.get('description', 'Unknown')}")
 
         lines.append("")
-        lines.append("=" * 60)
+        lines.append(_HEADER_SEP)
 
         return "\n".join(lines)
 
@@ -336,10 +495,10 @@ class DailyAggregator:
         lines = []
 
         # Header
-        lines.append("=" * 60)
+        lines.append(_HEADER_SEP)
         lines.append("📊 Team Daily Overview")
         lines.append(f"📅 Date: {overview['date']}")
-        lines.append("=" * 60)
+        lines.append(_HEADER_SEP)
 
         # Totals
         totals = overview["totals"]
@@ -352,11 +511,11 @@ class DailyAggregator:
 
         # Per-member summary
         lines.append("")
-        lines.append("-" * 60)
+        lines.append(_SUBSEP)
 
         for name, data in overview["team_members"].items():
             lines.append("")
-            standup_icon = "✅" if data["standup_posted"] else "⏳"
+            standup_icon = _ICON_DONE if data["standup_posted"] else _ICON_PENDING
             lines.append(f"👤 {name} {standup_icon}")
 
             counts = data["task_counts"]
@@ -370,7 +529,7 @@ class DailyAggregator:
                     lines.append(f"      • {task['name']} ({task['reason']})")
 
         lines.append("")
-        lines.append("=" * 60)
+        lines.append(_HEADER_SEP)
 
         return "\n".join(lines)
 
@@ -390,16 +549,16 @@ class DailyAggregator:
             actions.append("📝 Post your standup in #standup")
 
         # High priority channels
-        for ch in summary["high_priority_channels"][:3]:
+        for ch in islice(summary["high_priority_channels"], 3):
             actions.append(f"📺 Check {ch} for updates")
 
         # In-progress tasks
-        for task in summary["in_progress_tasks"][:2]:
+        for task in islice(summary["in_progress_tasks"], 2):
             actions.append(f"🔄 Continue: {task['name']}")
 
         # Pending high priority
-        high_priority = [t for t in summary["pending_tasks"] if t.get("priority") == "high"]
-        for task in high_priority[:2]:
+        high_priority = (t for t in summary["pending_tasks"] if t.get("priority") == "high")
+        for task in islice(high_priority, 2):
             actions.append(f"⚡ Start: {task['name']}")
 
         return actions
@@ -417,9 +576,8 @@ class DailyAggregator:
             "team_member": name,
             "completed_count": len(completed),
             "completed_tasks": completed,
-            "pending_for_tomorrow": [
-                t for t in summary["pending_tasks"] if t.get("status") != TaskStatus.COMPLETE.value
-            ],
+            # pending_tasks never contains completed tasks
+            "pending_for_tomorrow": summary["pending_tasks"],
             "in_progress_carryover": summary["in_progress_tasks"],
         }
 
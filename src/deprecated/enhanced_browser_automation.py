@@ -4,43 +4,258 @@ from __future__ import annotations
 
 import json
 import logging
+import random
 import re
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
+from urllib.parse import quote, urlsplit
 
 from src.browser_automation import (
     BrowserAutomationConfig,
     BrowserSession,
     SlackBrowserClient,
 )
+from src.cache_manager import CacheManager
+from src.dom_selectors import CHANNEL_HEADER_NAME, SEARCH_RESULT, DOMExtractor
 
 logger = logging.getLogger(__name__)
 
+# Slack channel IDs: public (C), DM (D) and legacy private group (G) conversations. Always fullmatch it.
+_CHANNEL_ID_RE = re.compile(r"[CDG][A-Z0-9]{8,}")
+
+# Slack's per-page cap for conversations.list.
+_CONVERSATIONS_LIST_LIMIT = 1000
+_CHANNEL_TYPES = "public_channel,private_channel"
+# Upper bound on the prewarm sweep (50k channels).
+_PREWARM_MAX_PAGES = 50
+# Slack Tier 3 methods (conversations.*) allow roughly 50 calls per minute.
+_API_CALLS_PER_MINUTE = 50
+
+
+# Channel IDs rarely change; user profiles (display names) do.
+_USER_CACHE_MAXSIZE = 10_000
+_USER_CACHE_TTL_SECONDS = 60 * 60
+_CHANNEL_CACHE_MAXSIZE = 5_000
+_CHANNEL_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Failed lookups are remembered briefly so retrying callers do not repeat the full walk.
+_NEGATIVE_CACHE_MAXSIZE = 1_000
+_NEGATIVE_CACHE_TTL_SECONDS = 5 * 60
+# Thread replies keep arriving, so they are only reused briefly.
+_THREAD_CACHE_MAXSIZE = 1_000
+_THREAD_CACHE_TTL_SECONDS = 5 * 60
+
+
+T = TypeVar("T")
+
+
+def _retry_with_backoff(
+    fn: Callable[[], T],
+    max_attempts: int = 3,
+    base: float = 1.0,
+    multiplier: float = 2.0,
+    max_delay: float = 30.0,
+    jitter: bool = True,
+) -> T:
+    """Call fn until it succeeds, sleeping with capped exponential backoff between attempts.
+
+    Jitter scales each delay by 0.5-1.5x so workers that failed together do not retry in lockstep.
+    The last attempt's exception is re-raised.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except Exception:
+            if attempt >= max_attempts - 1:
+                raise
+            delay = min(base * multiplier**attempt, max_delay)
+            if jitter:
+                delay *= 0.5 + random.random()
+            time.sleep(delay)
+    raise RuntimeError("max_attempts must be at least 1")
+
+
+def _channel_id_from_url(url: str, workspace_id: str) -> str | None:
+    """Return the channel ID segment of a Slack client or archives URL.
+
+    Only a whole path segment following ``/archives/`` or ``/client/<workspace>/``
+    counts, so ID-like runs inside channel names or other segments are ignored.
+    """
+    segments = urlsplit(url).path.split("/")
+    for previous, segment in zip(segments, segments[1:]):
+        if previous in ("archives", workspace_id) and _CHANNEL_ID_RE.fullmatch(segment):
+            return segment
+    return None
+
+
+class _TTLCache:
+    """Size-bounded LRU cache whose entries expire `ttl_seconds` after being stored."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or None when missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value, evicting the least recently used entry past maxsize."""
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class _TokenBucket:
+    """Blocking token bucket: refills `rate` tokens per second, bursting up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            time.sleep((1 - self._tokens) / self.rate)
+            self._updated = time.monotonic()
+            self._tokens = 1.0
+        self._tokens -= 1
+
 
 class EnhancedSlackBrowserClient(SlackBrowserClient):
     """Enhanced Slack browser client with improved reliability and features."""
 
-    def __init__(self, session: BrowserSession, config: BrowserAutomationConfig):
+    def __init__(
+        self,
+        session: BrowserSession,
+        config: BrowserAutomationConfig,
+        cache: CacheManager | None = None,
+    ):
         super().__init__(session, config)
-        self._user_cache: dict[str, dict[str, Any]] = {}
-        self._channel_cache: dict[str, str] = {}
-        self._message_cache: list[dict[str, Any]] = []
+        self._cache = cache
+        self._user_cache = _TTLCache(_USER_CACHE_MAXSIZE, _USER_CACHE_TTL_SECONDS)
+        self._channel_cache = _TTLCache(_CHANNEL_CACHE_MAXSIZE, _CHANNEL_CACHE_TTL_SECONDS)
+        self._channel_neg_cache = _TTLCache(_NEGATIVE_CACHE_MAXSIZE, _NEGATIVE_CACHE_TTL_SECONDS)
+        self._user_neg_cache = _TTLCache(_NEGATIVE_CACHE_MAXSIZE, _NEGATIVE_CACHE_TTL_SECONDS)
+        self._channel_cache_warmed = False
+        self._message_cache = _TTLCache(_THREAD_CACHE_MAXSIZE, _THREAD_CACHE_TTL_SECONDS)
+        self._rate_limiter = _TokenBucket(_API_CALLS_PER_MINUTE / 60, _API_CALLS_PER_MINUTE)
+
+    def _slack_api_call(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        method: str = "GET",
+        body: dict | None = None,
+    ) -> dict[str, Any]:
+        """Throttle API calls so bursts stay under Slack's per-minute limit before hitting 429s."""
+        self._rate_limiter.acquire()
+        return super()._slack_api_call(endpoint, params=params, method=method, body=body)
+
+    def prewarm_channel_cache(self) -> int:
+        """Fill the channel cache from one conversations.list sweep.
+
+        The name -> ID map is persisted through the CacheManager, when one is
+        configured, so restarts within its TTL skip the sweep entirely.
+
+        Returns:
+            Number of channels loaded
+        """
+        params = {"types": _CHANNEL_TYPES, "workspace": self.config.slack_workspace_id}
+        channels = self._cache.get("channel_ids", params) if self._cache else None
+        if not isinstance(channels, dict):
+            channels = {}
+            cursor = None
+            for _ in range(_PREWARM_MAX_PAGES):
+                page_params: dict[str, Any] = {
+                    "limit": _CONVERSATIONS_LIST_LIMIT,
+                    "types": _CHANNEL_TYPES,
+                    "exclude_archived": 1,
+                }
+                if cursor:
+                    page_params["cursor"] = cursor
+                data = self._slack_api_call("conversations.list", params=page_params)
+                for channel in data.get("channels", []):
+                    if channel.get("name") and channel.get("id"):
+                        channels[channel["name"]] = channel["id"]
+                cursor = data.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+            if self._cache:
+                self._cache.set("channel_ids", params, channels)
+
+        for name, channel_id in channels.items():
+            self._channel_cache.set(name, channel_id)
+        # Only a completed sweep counts; a failed one is retried on the next miss.
+        self._channel_cache_warmed = True
+        return len(channels)
+
+    def clear_caches(self) -> None:
+        """Drop cached user profiles, channel IDs and thread replies."""
+        self._user_cache.clear()
+        self._channel_cache.clear()
+        self._channel_neg_cache.clear()
+        self._user_neg_cache.clear()
+        self._message_cache.clear()
+        self._channel_cache_warmed = False
 
     def resolve_channel_id(self, channel_name: str) -> str | None:
         """Resolve channel ID with caching."""
-        # Check cache first
-        if channel_name in self._channel_cache:
-            return self._channel_cache[channel_name]
+        # Caches are keyed by the bare name, as stored by prewarm_channel_cache
+        bare_name = channel_name.lstrip("#")
+        cached_id: str | None = self._channel_cache.get(bare_name)
+        if cached_id:
+            return cached_id
+        if self._channel_neg_cache.get(bare_name):
+            return None
+
+        # Already a channel ID: nothing to look up
+        if _CHANNEL_ID_RE.fullmatch(bare_name):
+            self._channel_cache.set(bare_name, bare_name)
+            return bare_name
+
+        # First miss before a successful sweep: load every channel at once
+        if not self._channel_cache_warmed:
+            try:
+                self.prewarm_channel_cache()
+            except Exception as e:
+                logger.warning(f"Failed to prewarm channel cache: {e}")
+            warmed_id: str | None = self._channel_cache.get(bare_name)
+            if warmed_id:
+                return warmed_id
 
         # Try multiple methods to resolve channel
-        channel_id = None
+        channel_id: str | None = None
 
-        # Method 1: Try conversations.list
-        try:
-            channel_id = self._resolve_via_conversations_list(channel_name)
-        except Exception as e:
-            logger.warning(f"Failed to resolve channel via conversations.list: {e}")
+        # Method 1: Try conversations.list, unless a completed sweep already walked it
+        if not self._channel_cache_warmed:
+            try:
+                channel_id = self._resolve_via_conversations_list(channel_name)
+            except Exception as e:
+                logger.warning(f"Failed to resolve channel via conversations.list: {e}")
 
         # Method 2: Try browser navigation
         if not channel_id:
@@ -51,7 +266,9 @@ class EnhancedSlackBrowserClient(SlackBrowserClient):
 
         # Cache result
         if channel_id:
-            self._channel_cache[channel_name] = channel_id
+            self._channel_cache.set(bare_name, channel_id)
+        else:
+            self._channel_neg_cache.set(bare_name, True)
 
         return channel_id
 
@@ -62,7 +279,11 @@ class EnhancedSlackBrowserClient(SlackBrowserClient):
 
         cursor = None
         for _ in range(10):  # Max 10 pages
-            params = {"limit": 200, "types": "public_channel,private_channel"}
+            params: dict[str, Any] = {
+                "limit": _CONVERSATIONS_LIST_LIMIT,
+                "types": _CHANNEL_TYPES,
+                "exclude_archived": 1,
+            }
             if cursor:
                 params["cursor"] = cursor
 
@@ -87,16 +308,14 @@ class EnhancedSlackBrowserClient(SlackBrowserClient):
         url = f"{self.config.slack_client_url}/{workspace_id}/channels/{name}"
         page = self.session.new_page(url)
 
-        # Wait for page to load
-        time.sleep(2)
+        # Wait for the channel header rather than a fixed delay
+        DOMExtractor(page).wait_for_element(CHANNEL_HEADER_NAME, timeout=10000)
 
         # Try to extract channel ID from URL or page content
         try:
-            current_url = page.url
-            # Look for channel ID pattern in URL
-            match = re.search(r"[CD][A-Z0-9]{8,}", current_url)
-            if match:
-                return match.group(0)
+            url_channel_id = _channel_id_from_url(page.url, workspace_id)
+            if url_channel_id:
+                return url_channel_id
         except Exception:
             pass
 
@@ -112,15 +331,19 @@ class EnhancedSlackBrowserClient(SlackBrowserClient):
 
     def get_user_info_cached(self, user_id: str) -> dict[str, Any]:
         """Get user info with caching."""
-        if user_id in self._user_cache:
-            return self._user_cache[user_id]
+        cached_user: dict[str, Any] | None = self._user_cache.get(user_id)
+        if cached_user is not None:
+            return cached_user
+        if self._user_neg_cache.get(user_id):
+            return {"id": user_id, "name": user_id}
 
         try:
             user_info = self.get_user_info(user_id)
-            self._user_cache[user_id] = user_info
+            self._user_cache.set(user_id, user_info)
             return user_info
         except Exception as e:
             logger.warning(f"Failed to get user info for {user_id}: {e}")
+            self._user_neg_cache.set(user_id, True)
             return {"id": user_id, "name": user_id}
 
     def resolve_user_name(self, user_id: str) -> str:
@@ -156,10 +379,11 @@ class EnhancedSlackBrowserClient(SlackBrowserClient):
         )
 
         # Add permalinks
+        permalink_prefix = f"https://quickerleads.slack.com/archives/{channel_id}/p"
         for msg in messages:
             ts = msg.get("ts", "").replace(".", "")
             if ts:
-                msg["permalink"] = f"https://quickerleads.slack.com/archives/{channel_id}/p{ts}"
+                msg["permalink"] = permalink_prefix + ts
 
         return messages
 
@@ -180,13 +404,13 @@ class EnhancedSlackBrowserClient(SlackBrowserClient):
     def _browser_search(self, query: str, count: int) -> list[dict[str, Any]]:
         """Perform search using browser navigation."""
         workspace_id = self.config.slack_workspace_id
-        encoded_query = query.replace(" ", "%20")
+        encoded_query = quote(query, safe="")
 
         url = f"{self.config.slack_client_url}/{workspace_id}/search/{encoded_query}"
         page = self.session.new_page(url)
 
         # Wait for search results to load
-        time.sleep(3)
+        DOMExtractor(page).wait_for_element(SEARCH_RESULT, timeout=15000)
 
         # Extract search results from page
         # This is a simplified version - in practice you'd need more robust extraction
@@ -267,14 +491,24 @@ class EnhancedSlackBrowserClient(SlackBrowserClient):
 
         # Fetch thread replies for messages with replies
         all_messages = []
+        seen_threads: set[str] = set()
         for msg in messages:
             all_messages.append(msg)
 
             # Check if message has replies
             reply_count = msg.get("reply_count", 0)
             if reply_count > 0:
-                thread_ts = msg.get("thread_ts") or msg.get("ts")
-                replies = self.get_thread_replies(channel_id, cast(str, thread_ts))
+                thread_ts = cast(str, msg.get("thread_ts") or msg.get("ts"))
+                if thread_ts in seen_threads:
+                    continue
+                cache_key = f"{channel_id}:{thread_ts}"
+                replies: list[dict[str, Any]] | None = self._message_cache.get(cache_key)
+                if replies is None:
+                    replies = self.get_thread_replies(channel_id, thread_ts)
+                    if replies:
+                        self._message_cache.set(cache_key, replies)
+                if replies:
+                    seen_threads.add(thread_ts)
                 # Skip the parent message (first in replies)
                 all_messages.extend(replies[1:])
 
@@ -295,25 +529,25 @@ class BrowserAutomationManager:
         if self._is_connected and self.client:
             return self.client
 
-        max_retries = 3
-        for attempt in range(max_retries):
+        attempts = 0
+
+        def attempt() -> EnhancedSlackBrowserClient:
+            nonlocal attempts
+            attempts += 1
+            self.session = BrowserSession(self.config)
             try:
-                self.session = BrowserSession(self.config)
                 self.session.start()
-                self.client = EnhancedSlackBrowserClient(self.session, self.config)
-                self._is_connected = True
-                logger.info("Successfully connected to Slack via browser")
-                return self.client
+                client = EnhancedSlackBrowserClient(self.session, self.config)
             except Exception as e:
-                logger.error(f"Connection attempt {attempt + 1} failed: {e}")
-                if self.session:
-                    self.session.close()
-                if attempt < max_retries - 1:
-                    time.sleep(5 * (attempt + 1))
-                else:
-                    raise
+                logger.error(f"Connection attempt {attempts} failed: {e}")
+                self.session.close()
+                raise
+            self.client = client
+            self._is_connected = True
+            logger.info("Successfully connected to Slack via browser")
+            return client
 
-        raise RuntimeError("Failed to connect after all retries")
+        return _retry_with_backoff(attempt, max_attempts=3)
 
     def disconnect(self) -> None:
         """Disconnect from browser."""
@@ -383,17 +617,17 @@ def verify_storage_state(storage_state_path: str) -> bool:
         return False
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            state = json.load(f)
+        state = json.loads(path.read_bytes())
 
         # Check for required fields
         if "cookies" not in state:
             return False
 
         # Check if any cookies are expired
+        now = time.time()
         for cookie in state.get("cookies", []):
             expires = cookie.get("expires", 0)
-            if expires and expires < time.time():
+            if expires and expires < now:
                 return False
 
         return True
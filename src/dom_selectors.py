@@ -7,253 +7,327 @@ fallback strategies for resilience against UI changes.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, cast
 
 
-@dataclass
+@dataclass(frozen=True)
 class SelectorSet:
     """A set of selectors with fallbacks."""
 
     primary: str
-    fallbacks: list[str]
+    fallbacks: tuple[str, ...]
+    _all: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-    def get_all(self) -> list[str]:
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_all", (self.primary, *self.fallbacks))
+
+    def get_all(self) -> tuple[str, ...]:
         """Get all selectors in order of preference."""
-        return [self.primary] + self.fallbacks
+        return self._all
 
 
 # Message list containers
 MESSAGE_LIST_CONTAINER = SelectorSet(
     primary='[data-qa="virtual_list"]',
-    fallbacks=[
+    fallbacks=(
         '[data-qa="message_list"]',
         ".c-virtual_list__scroll_container",
         ".p-message_pane__virtual_list",
         '[role="main"] .c-message_list',
         ".c-message_list",
-    ],
+    ),
 )
 
 # Individual message containers
 MESSAGE_CONTAINER = SelectorSet(
     primary='[data-qa="message_container"]',
-    fallbacks=[
+    fallbacks=(
         ".c-message",
         ".c-message--light",
-    ],
+    ),
 )
 
 # Message content/text
 MESSAGE_CONTENT = SelectorSet(
     primary='[data-qa="message_content"]',
-    fallbacks=[
+    fallbacks=(
         ".c-message__body",
         ".p-rich_text_section",
         ".c-message__message_content",
-    ],
+    ),
 )
 
 # Message sender/user
 MESSAGE_SENDER = SelectorSet(
     primary='[data-qa="message_sender"]',
-    fallbacks=[
+    fallbacks=(
         ".c-message__sender",
         ".p-classic_nav__model__title",
         '[data-qa="message_container"] .c-custom_status',
-    ],
+    ),
 )
 
 # Message timestamp
 MESSAGE_TIMESTAMP = SelectorSet(
     primary="a[data-ts]",
-    fallbacks=[
+    fallbacks=(
         "time[data-ts]",
         "time",
         "[data-ts]",
         ".c-timestamp__label",
-    ],
+    ),
 )
 
 # User avatar (contains user ID)
 USER_AVATAR = SelectorSet(
     primary="img[data-member-id]",
-    fallbacks=[
+    fallbacks=(
         "img[data-user-id]",
         ".c-avatar img",
         '[data-qa="message_container"] img',
-    ],
+    ),
 )
 
 # Channel sidebar
 CHANNEL_SIDEBAR = SelectorSet(
     primary='[data-qa="channel-sidebar"]',
-    fallbacks=[
+    fallbacks=(
         '[data-qa="channel_sidebar"]',
         '[data-qa-channel-sidebar="true"]',
         ".p-workspace__sidebar",
         ".p-channel_sidebar",
         '[role="navigation"]',
-    ],
+    ),
 )
 
 # Channel name in header
 CHANNEL_HEADER_NAME = SelectorSet(
     primary='[data-qa="channel_name"]',
-    fallbacks=[
+    fallbacks=(
         ".p-classic_nav__model__title",
         ".p-view_header__title",
         "h1[data-qa]",
-    ],
+    ),
 )
 
 # Channel topic
 CHANNEL_TOPIC = SelectorSet(
     primary='[data-qa="channel_topic"]',
-    fallbacks=[
+    fallbacks=(
         ".p-classic_nav__model__subtitle",
         ".p-view_header__subtitle",
-    ],
+    ),
 )
 
 # Search results
 SEARCH_RESULT = SelectorSet(
     primary='[data-qa="search_result"]',
-    fallbacks=[
+    fallbacks=(
         ".p-search_result",
         ".c-search_result",
         '[data-qa="search_message_result"]',
-    ],
+    ),
 )
 
 # Thread pane containers
 THREAD_PANE_CONTAINER = SelectorSet(
     primary='[data-qa="thread_view_messages"]',
-    fallbacks=[
+    fallbacks=(
         '[data-qa="thread_view"]',
         '[aria-label*="Thread"] [data-qa="virtual_list"]',
         ".p-thread_view",
         ".p-workspace__secondary_view",
-    ],
+    ),
 )
 
 # Messages inside thread pane
 THREAD_MESSAGE_CONTAINER = SelectorSet(
     primary='[data-qa="thread_view_messages"] [data-qa="message_container"]',
-    fallbacks=[
+    fallbacks=(
         '[data-qa="thread_view"] [data-qa="message_container"]',
         ".p-thread_view .c-message",
         ".p-workspace__secondary_view .c-message",
-    ],
+    ),
 )
 
 # Login indicators
 LOGIN_EMAIL_INPUT = SelectorSet(
     primary='[data-qa="login_email"]',
-    fallbacks=[
+    fallbacks=(
         'input[type="email"]',
         'input[name="email"]',
         "#email",
-    ],
+    ),
 )
 
 LOGIN_PASSWORD_INPUT = SelectorSet(
     primary='[data-qa="login_password"]',
-    fallbacks=[
+    fallbacks=(
         'input[type="password"]',
         'input[name="password"]',
         "#password",
-    ],
+    ),
 )
 
 # Logged-in indicators
 TEAM_MENU = SelectorSet(
     primary='[data-qa="team-menu"]',
-    fallbacks=[
+    fallbacks=(
         ".p-team_menu",
         '[data-qa="user-button"]',
         ".p-workspace__top_nav",
-    ],
+    ),
 )
 
 # Day dividers (date separators)
 DAY_DIVIDER = SelectorSet(
     primary='[data-qa="day_divider"]',
-    fallbacks=[
+    fallbacks=(
         ".c-message_list__day_divider",
         ".p-message_pane__day_divider",
-    ],
+    ),
 )
 
 # Thread replies indicator
 THREAD_REPLIES = SelectorSet(
     primary='[data-qa="thread_replies"]',
-    fallbacks=[
+    fallbacks=(
         ".c-message__reply_count",
         '[data-qa="reply_count"]',
-    ],
+    ),
 )
 
 
 # Message actions menu
 MESSAGE_ACTIONS = SelectorSet(
     primary='[data-qa="message_actions_menu"]',
-    fallbacks=[
+    fallbacks=(
         ".c-message__actions",
         ".c-message_actions__container",
-    ],
+    ),
 )
 
 # Notion Selectors
 NOTION_MAIN = SelectorSet(
     primary="div[role='main']",
-    fallbacks=["#notion-app", ".notion-app-inner"],
+    fallbacks=("#notion-app", ".notion-app-inner"),
 )
 
 NOTION_PAGE_CANVAS = SelectorSet(
     primary="div[data-qa='page-canvas']",
-    fallbacks=[".notion-page-content", ".notion-scroller"],
+    fallbacks=(".notion-page-content", ".notion-scroller"),
 )
 
 NOTION_READY_INDICATORS = SelectorSet(
     primary="div[role='main']",
-    fallbacks=[
+    fallbacks=(
         "div[data-qa='page-canvas']",
         ".notion-page-content",
         "#notion-app",
         ".notion-app-inner",
-    ],
+    ),
 )
 
 NOTION_CONTENT_EDITABLE = SelectorSet(
     primary="div[contenteditable='true']",
-    fallbacks=[".notion-selectable[contenteditable='true']", "[placeholder='Untitled']"],
+    fallbacks=(".notion-selectable[contenteditable='true']", "[placeholder='Untitled']"),
 )
 
 # BugHerd Selectors
 BUGHERD_ADD_TASK = SelectorSet(
     primary='[data-testid="add-task-button"]',
-    fallbacks=["#add-task-button", 'button:has-text("Add Task")', ".add-task-btn"],
+    fallbacks=("#add-task-button", 'button:has-text("Add Task")', ".add-task-btn"),
 )
 
 BUGHERD_TASK_TITLE = SelectorSet(
     primary='textarea[placeholder*="title"]',
-    fallbacks=["textarea.task-title", 'input[name="title"]', ".task-title-input"],
+    fallbacks=("textarea.task-title", 'input[name="title"]', ".task-title-input"),
 )
 
 BUGHERD_TASK_DESCRIPTION = SelectorSet(
     primary='textarea[placeholder*="description"]',
-    fallbacks=["textarea.task-description", ".task-desc-input"],
+    fallbacks=("textarea.task-description", ".task-desc-input"),
 )
 
 BUGHERD_SUBMIT = SelectorSet(
     primary='button:has-text("Create")',
-    fallbacks=['button[type="submit"]', 'button:has-text("Save")', ".submit-btn"],
+    fallbacks=('button[type="submit"]', 'button:has-text("Save")', ".submit-btn"),
 )
 
 BUGHERD_READY_INDICATORS = SelectorSet(
     primary=".task-list",
-    fallbacks=[".project-tasks", "[data-testid='task-list']", ".ant-layout"],
+    fallbacks=(".project-tasks", "[data-testid='task-list']", ".ant-layout"),
+)
+
+
+# Selector fallbacks for each message field, passed to _EXTRACT_MESSAGE_JS as-is.
+_MESSAGE_FIELD_SELECTORS = {
+    "text": list(MESSAGE_CONTENT.get_all()),
+    "user": list(MESSAGE_SENDER.get_all()),
+    "avatar": list(USER_AVATAR.get_all()),
+    "timestamp": list(MESSAGE_TIMESTAMP.get_all()),
+}
+
+# Reads every message field inside the page. Each field takes the first selector whose
+# first match is visible (non-empty box, not visibility:hidden), like Locator.is_visible.
+_EXTRACT_MESSAGE_JS = """(el, sel) => {
+    const visible = (node) => {
+        if (!node) return false;
+        const rect = node.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(node).visibility !== "hidden";
+    };
+    const first = (selectors, suffix = "") => {
+        for (const selector of selectors) {
+            const node = el.querySelector(selector + suffix);
+            if (visible(node)) return node;
+        }
+        return null;
+    };
+    const text = first(sel.text);
+    const user = first(sel.user);
+    const avatar = first(sel.avatar);
+    const timestamp = first(sel.timestamp);
+    const link = first(sel.timestamp, "[href]");
+    return {
+        text: text ? (text.textContent || "").trim() : "",
+        user: user ? (user.textContent || "").trim() : "Unknown",
+        user_id: avatar ? avatar.getAttribute("data-member-id") || avatar.getAttribute("data-user-id") || "" : "",
+        ts: timestamp ? timestamp.getAttribute("data-ts") || timestamp.getAttribute("datetime") || "" : "",
+        href: link ? link.getAttribute("href") || "" : "",
+    };
+}"""
+
+# True once the first match of any selector is visible; used as a wait_for_function predicate.
+_ANY_SELECTOR_VISIBLE_JS = """(selectors) => selectors.some((selector) => {
+    let node = null;
+    try {
+        node = document.querySelector(selector);
+    } catch (e) {
+        return false;
+    }
+    if (!node) return false;
+    const rect = node.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(node).visibility !== "hidden";
+})"""
+
+# Runs _EXTRACT_MESSAGE_JS over every element matched by any container selector, each element once.
+_EXTRACT_ALL_MESSAGES_JS = (
+    """({containers, fields}) => {
+    const extract = """
+    + _EXTRACT_MESSAGE_JS
+    + """;
+    const seen = new Set();
+    const results = [];
+    for (const selector of containers) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (seen.has(el)) continue;
+            seen.add(el);
+            results.push(extract(el, fields));
+        }
+    }
+    return results;
+}"""
 )
 
 
@@ -275,93 +349,54 @@ class DOMExtractor:
         return None
 
     def wait_for_element(self, selector_set: SelectorSet, timeout: int = 10000) -> bool:
-        """Wait for any selector in set to appear."""
-        for selector in selector_set.get_all():
-            try:
-                self.page.wait_for_selector(selector, timeout=timeout)
-                return True
-            except Exception:
-                continue
-        return False
+        """Wait for any selector in set to appear.
 
-    def extract_message_data(self, message_element: Any, require_text: bool = True) -> dict[str, Any] | None:
-        """Extract all data from a message element."""
+        All selectors are polled together in the page, so a missing primary no
+        longer costs a full timeout before the fallbacks are tried. Selectors
+        must be plain CSS.
+        """
         try:
-            data = {
-                "text": self._extract_text(message_element),
-                "user": self._extract_user(message_element),
-                "user_id": self._extract_user_id(message_element),
-                "ts": self._extract_timestamp(message_element),
-                "permalink": self._extract_permalink(message_element),
-            }
-
-            # In thread panes some entries can render with minimal text; allow metadata-only extraction.
-            if data["text"] or (not require_text and (data["ts"] or data["permalink"] or data["user_id"])):
-                return data
+            self.page.wait_for_function(_ANY_SELECTOR_VISIBLE_JS, arg=list(selector_set.get_all()), timeout=timeout)
+            return True
+        except Exception:
+            return False
 
+    def extract_message_data(self, message_element: Any, require_text: bool = True) -> dict[str, Any] | None:
+        """Extract all data from a message element in a single browser round-trip."""
+        try:
+            data = cast(dict[str, Any], message_element.evaluate(_EXTRACT_MESSAGE_JS, _MESSAGE_FIELD_SELECTORS))
+            return self._finish_message_data(data, require_text)
         except Exception:
             # Log error but don't fail - message might be malformed
-            pass
-
-        return None
-
-    def _extract_text(self, element: Any) -> str:
-        """Extract message text."""
-        for selector in MESSAGE_CONTENT.get_all():
-            try:
-                text_el = element.locator(selector).first
-                if text_el.is_visible(timeout=1000):
-                    return cast(str, text_el.text_content()).strip()
-            except Exception:
-                continue
-        return ""
-
-    def _extract_user(self, element: Any) -> str:
-        """Extract user name."""
-        for selector in MESSAGE_SENDER.get_all():
-            try:
-                user_el = element.locator(selector).first
-                if user_el.is_visible(timeout=1000):
-                    return cast(str, user_el.text_content()).strip()
-            except Exception:
-                continue
-        return "Unknown"
-
-    def _extract_user_id(self, element: Any) -> str:
-        """Extract user ID from avatar."""
-        for selector in USER_AVATAR.get_all():
-            try:
-                avatar = element.locator(selector).first
-                if avatar.is_visible(timeout=1000):
-                    return avatar.get_attribute("data-member-id") or avatar.get_attribute("data-user-id") or ""
-            except Exception:
-                continue
-        return ""
-
-    def _extract_timestamp(self, element: Any) -> str:
-        """Extract message timestamp."""
-        for selector in MESSAGE_TIMESTAMP.get_all():
-            try:
-                ts_el = element.locator(selector).first
-                if ts_el.is_visible(timeout=1000):
-                    return ts_el.get_attribute("data-ts") or ts_el.get_attribute("datetime") or ""
-            except Exception:
-                continue
-        return ""
+            return None
 
-    def _extract_permalink(self, element: Any) -> str:
-        """Extract message permalink."""
+    def extract_all_messages(
+        self, container: SelectorSet = MESSAGE_CONTAINER, require_text: bool = True
+    ) -> list[dict[str, Any]]:
+        """Extract every message on the page in a single browser round-trip."""
         try:
-            # Look for timestamp link which contains permalink
-            for selector in MESSAGE_TIMESTAMP.get_all():
-                link = element.locator(f"{selector}[href]").first
-                if link.is_visible(timeout=1000):
-                    href = link.get_attribute("href")
-                    if href:
-                        return href if href.startswith("http") else f"https://quickerleads.slack.com{href}"
+            raw = self.page.evaluate(
+                _EXTRACT_ALL_MESSAGES_JS, {"containers": list(container.get_all()), "fields": _MESSAGE_FIELD_SELECTORS}
+            )
         except Exception:
-            pass
-        return ""
+            return []
+        messages = []
+        for data in cast(list[dict[str, Any]], raw):
+            message = self._finish_message_data(data, require_text)
+            if message:
+                messages.append(message)
+        return messages
+
+    @staticmethod
+    def _finish_message_data(data: dict[str, Any], require_text: bool) -> dict[str, Any] | None:
+        """Expand the permalink and drop entries without usable content."""
+        href = data.pop("href")
+        data["permalink"] = href if not href or href.startswith("http") else f"https://quickerleads.slack.com{href}"
+
+        # In thread panes some entries can render with minimal text; allow metadata-only extraction.
+        if data["text"] or (not require_text and (data["ts"] or data["permalink"] or data["user_id"])):
+            return data
+        return None
 
     def is_message_visible(self, element: Any) -> bool:
         """Check if element is a visible message."""
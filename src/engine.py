@@ -1,13 +1,21 @@
 import argparse
+import atexit
 import json
 import logging
 import os
+import threading
 import time
+from collections import ChainMap
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, cast
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, cast
+
+import requests
 
 from .audit_logger import AuditLogger
-from .browser import BrowserAutomationConfig, BrowserSession, NotionBrowserClient, SlackBrowserClient
 from .config_loader import get_project, load_config
 from .config_validation import validate_or_raise
 from .logging_utils import configure_logging, log_event
@@ -19,10 +27,8 @@ from .summarizer import ActivitySummarizer
 from .thread_extractor import ThreadExtractor
 from .ticket_manager import TicketManager
 
-try:
-    from .browser import SlackNotionCrossReferencer
-except ImportError:
-    SlackNotionCrossReferencer = None  # type: ignore
+if TYPE_CHECKING:
+    from .browser import BrowserAutomationConfig, BrowserSession, NotionBrowserClient, SlackBrowserClient
 
 try:
     from .integrations import BugHerdBridge, QABridge
@@ -30,52 +36,201 @@ except ImportError:
     BugHerdBridge = None  # type: ignore
     QABridge = None  # type: ignore
 
-from .utils import iso_to_unix_ts, make_run_id, utc_now_iso
+from .utils import coerce_bool, iso_to_unix_ts, make_run_id, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 def _coerce_int(value: object, default: int) -> int:
+    # Config values are nearly always plain ints already; skip the checks below for them.
+    if type(value) is int:
+        return value
     try:
         if value is None or value == "":
             return default
-        if isinstance(value, bool):
-            return int(value)
-        if isinstance(value, (int, float)):
-            return int(value)
-        if isinstance(value, str):
+        # bool is an int subclass, so it is covered here too.
+        if isinstance(value, (int, float, str)):
             return int(value)
         return default
     except (TypeError, ValueError):
         return default
 
 
-def _coerce_bool(value: object, default: bool) -> bool:
-    if value is None:
-        return default
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        return value.strip().lower() in {"true", "1", "yes", "y"}
-    return bool(value)
-
-
 def _effective_feature(feature_settings: dict, project: dict, key: str) -> bool:
     project_value = project.get(key)
     if project_value is None:
-        return _coerce_bool(feature_settings.get(key), True)
-    return _coerce_bool(project_value, True)
+        return coerce_bool(feature_settings.get(key), True)
+    return coerce_bool(project_value, True)
+
+
+_SYNC_FEATURES = (
+    "enable_audit",
+    "enable_notion_audit_note",
+    "enable_notion_last_synced",
+    "enable_slack_topic_update",
+    "enable_run_id_idempotency",
+)
 
 
 def _deep_merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
+    # Exact type checks: merged values come from JSON, so they are plain dicts or leaves.
     for key, value in overrides.items():
-        if isinstance(value, dict) and isinstance(base.get(key), dict):
-            _deep_merge(base[key], value)
+        existing = base.get(key)
+        if type(value) is dict and type(existing) is dict:
+            _deep_merge(existing, value)
         else:
             base[key] = value
     return base
 
 
+_PAGINATION_DEFAULTS = {"history_limit": 200, "history_max_pages": 5, "search_limit": 100, "search_max_pages": 3}
+
+
+def _coerce_pagination(pagination: Mapping[str, Any]) -> dict[str, int]:
+    return {key: _coerce_int(pagination.get(key), default) for key, default in _PAGINATION_DEFAULTS.items()}
+
+
+@dataclass(slots=True, frozen=True)
+class _SlackSettings:
+    """settings.slack parsed once at startup."""
+
+    token_env: str
+    base_url: str
+    timeout: int
+    retries: dict[str, Any]
+    default_channel_id: str
+    pagination: dict[str, Any]
+    # Defaults already coerced, for projects without slack_pagination overrides.
+    coerced_pagination: dict[str, int]
+
+    @classmethod
+    def from_config(cls, settings: dict[str, Any]) -> "_SlackSettings":
+        pagination = settings.get("pagination", {})
+        return cls(
+            token_env=settings.get("token_env", "SLACK_BOT_TOKEN"),
+            base_url=settings["base_url"],
+            timeout=_coerce_int(settings.get("timeout_seconds"), 30),
+            retries=settings.get("retries", {}),
+            default_channel_id=settings.get("default_channel_id") or "",
+            pagination=pagination,
+            coerced_pagination=_coerce_pagination(pagination),
+        )
+
+
+def _is_browser_client(client: object) -> bool:
+    return getattr(client, "is_browser_fallback", False) is True
+
+
+def _build_browser_config(browser_settings: dict[str, Any]) -> "BrowserAutomationConfig":
+    from .browser import BrowserAutomationConfig
+
+    return BrowserAutomationConfig(
+        enabled=browser_settings.get("enabled", False),
+        storage_state_path=browser_settings.get("storage_state_path", ""),
+        headless=browser_settings.get("headless", True),
+        slow_mo_ms=_coerce_int(browser_settings.get("slow_mo_ms"), 0),
+        timeout_ms=_coerce_int(browser_settings.get("timeout_ms"), 30000),
+        browser_channel=browser_settings.get("browser_channel"),
+        user_data_dir=browser_settings.get("user_data_dir"),
+        slack_workspace_id=browser_settings.get("slack_workspace_id", ""),
+        slack_client_url=browser_settings.get("slack_client_url", "https://app.slack.com/client"),
+        slack_api_base_url=browser_settings.get("slack_api_base_url", "https://slack.com/api"),
+        notion_base_url=browser_settings.get("notion_base_url", "https://www.notion.so"),
+        verbose_logging=browser_settings.get("verbose_logging", False),
+        keep_open=browser_settings.get("keep_open", False),
+        interactive_login=browser_settings.get("interactive_login", True),
+        interactive_login_timeout_ms=_coerce_int(browser_settings.get("interactive_login_timeout_ms"), 120000),
+        auto_save_storage_state=browser_settings.get("auto_save_storage_state", True),
+        auto_recover=browser_settings.get("auto_recover", True),
+        auto_recover_refresh=browser_settings.get("auto_recover_refresh", True),
+        smart_wait=browser_settings.get("smart_wait", True),
+        smart_wait_network_idle=browser_settings.get("smart_wait_network_idle", True),
+        smart_wait_timeout_ms=_coerce_int(browser_settings.get("smart_wait_timeout_ms"), 15000),
+        smart_wait_stability_ms=_coerce_int(browser_settings.get("smart_wait_stability_ms"), 600),
+        overlay_enabled=browser_settings.get("overlay_enabled", False),
+        recordings_dir=browser_settings.get("recordings_dir", "output/browser_recordings"),
+        html_snapshot_on_error=browser_settings.get("html_snapshot_on_error", True),
+        event_log_path=browser_settings.get("event_log_path", "output/browser_events.jsonl"),
+        screenshot_on_step=browser_settings.get("screenshot_on_step", False),
+        screenshot_on_error=browser_settings.get("screenshot_on_error", True),
+    )
+
+
+_http_session: requests.Session | None = None
+
+
+def _shared_http_session() -> requests.Session:
+    """One keep-alive session for every API client in the process, closed at exit."""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        atexit.register(_http_session.close)
+    return _http_session
+
+
+class _BrowserSessionPool:
+    """Idle keep_open browser sessions, so a later engine on the same thread skips the browser cold start.
+
+    Only sessions whose config sets keep_open are pooled; everything else is closed by
+    ScalersSlackEngine.close(). Entries are keyed by the owning thread object rather than its
+    ident, because Playwright's sync objects must stay on the thread that started them and
+    idents are reused once a thread exits.
+    """
+
+    _idle: dict[tuple[str, threading.Thread], list["BrowserSession"]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(config: "BrowserAutomationConfig") -> tuple[str, threading.Thread]:
+        return repr(config), threading.current_thread()
+
+    @classmethod
+    def _evict_finished_threads(cls) -> None:
+        # Callers hold _lock. A dead thread's sessions cannot be closed from here, so they are only dropped.
+        for key in [key for key in cls._idle if not key[1].is_alive()]:
+            dropped = cls._idle.pop(key)
+            logger.warning("Dropping %d pooled browser session(s) from finished thread %s", len(dropped), key[1].name)
+
+    @classmethod
+    def acquire(cls, config: "BrowserAutomationConfig") -> "BrowserSession":
+        if config.keep_open:
+            with cls._lock:
+                cls._evict_finished_threads()
+                idle = cls._idle.get(cls._key(config))
+                if idle:
+                    return idle.pop()
+        from .browser import BrowserSession
+
+        return BrowserSession(config)
+
+    @classmethod
+    def release(cls, session: "BrowserSession") -> None:
+        with cls._lock:
+            cls._evict_finished_threads()
+            idle = cls._idle.setdefault(cls._key(session.config), [])
+            if session not in idle:
+                idle.append(session)
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close the calling thread's pooled sessions and drop any left by finished threads."""
+        current = threading.current_thread()
+        with cls._lock:
+            cls._evict_finished_threads()
+            keys = [key for key in cls._idle if key[1] is current]
+            sessions = [session for key in keys for session in cls._idle.pop(key)]
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as exc:
+                logger.warning("Failed to close pooled browser session: %s", exc)
+
+
+atexit.register(_BrowserSessionPool.close_all)
+
+
 class ScalersSlackEngine:
     def __init__(
         self,
@@ -86,7 +241,7 @@ class ScalersSlackEngine:
         audit_logger: AuditLogger | None = None,
         thread_extractor: ThreadExtractor | None = None,
     ):
-        self.base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.base_path = _BASE_PATH
         self.config = config or load_config(config_path)
         self.memory = ProjectMemory()
         self.last_run_summary: dict[str, Any] | None = None
@@ -101,52 +256,22 @@ class ScalersSlackEngine:
         if self.config.get("settings", {}).get("validate_config_on_startup", True):
             validate_or_raise(self.config)
 
-        slack_settings = self.config["settings"]["slack"]
+        slack_settings = _SlackSettings.from_config(self.config["settings"]["slack"])
         notion_settings = self.config["settings"]["notion"]
         audit_settings = self.config["settings"]["audit"]
         browser_settings = self.config["settings"].get("browser_automation", {})
         feature_settings = self.config["settings"].get("features", {})
 
-        browser_config = BrowserAutomationConfig(
-            enabled=browser_settings.get("enabled", False),
-            storage_state_path=browser_settings.get("storage_state_path", ""),
-            headless=browser_settings.get("headless", True),
-            slow_mo_ms=_coerce_int(browser_settings.get("slow_mo_ms"), 0),
-            timeout_ms=_coerce_int(browser_settings.get("timeout_ms"), 30000),
-            browser_channel=browser_settings.get("browser_channel"),
-            user_data_dir=browser_settings.get("user_data_dir"),
-            slack_workspace_id=browser_settings.get("slack_workspace_id", ""),
-            slack_client_url=browser_settings.get("slack_client_url", "https://app.slack.com/client"),
-            slack_api_base_url=browser_settings.get("slack_api_base_url", "https://slack.com/api"),
-            notion_base_url=browser_settings.get("notion_base_url", "https://www.notion.so"),
-            verbose_logging=browser_settings.get("verbose_logging", False),
-            keep_open=browser_settings.get("keep_open", False),
-            interactive_login=browser_settings.get("interactive_login", True),
-            interactive_login_timeout_ms=_coerce_int(browser_settings.get("interactive_login_timeout_ms"), 120000),
-            auto_save_storage_state=browser_settings.get("auto_save_storage_state", True),
-            auto_recover=browser_settings.get("auto_recover", True),
-            auto_recover_refresh=browser_settings.get("auto_recover_refresh", True),
-            smart_wait=browser_settings.get("smart_wait", True),
-            smart_wait_network_idle=browser_settings.get("smart_wait_network_idle", True),
-            smart_wait_timeout_ms=_coerce_int(browser_settings.get("smart_wait_timeout_ms"), 15000),
-            smart_wait_stability_ms=_coerce_int(browser_settings.get("smart_wait_stability_ms"), 600),
-            overlay_enabled=browser_settings.get("overlay_enabled", False),
-            recordings_dir=browser_settings.get("recordings_dir", "output/browser_recordings"),
-            html_snapshot_on_error=browser_settings.get("html_snapshot_on_error", True),
-            event_log_path=browser_settings.get("event_log_path", "output/browser_events.jsonl"),
-            screenshot_on_step=browser_settings.get("screenshot_on_step", False),
-            screenshot_on_error=browser_settings.get("screenshot_on_error", True),
-        )
-        slack_token = os.getenv(slack_settings.get("token_env", "SLACK_BOT_TOKEN"))
+        slack_token = os.getenv(slack_settings.token_env)
         notion_token = os.getenv(notion_settings.get("token_env", "NOTION_API_KEY"))
-        slack_timeout = _coerce_int(slack_settings.get("timeout_seconds"), 30)
         notion_timeout = _coerce_int(notion_settings.get("timeout_seconds"), 30)
-        slack_retries = slack_settings.get("retries", {})
         notion_retries = notion_settings.get("retries", {})
 
-        needs_browser = browser_config.enabled and (not slack_token or not notion_token)
+        needs_browser = bool(browser_settings.get("enabled", False)) and (not slack_token or not notion_token)
         self.browser_enabled = needs_browser
+        self._browser_settings = browser_settings
         if needs_browser:
+            browser_config = self.browser_config
             if (
                 browser_config.storage_state_path
                 and not os.path.exists(browser_config.storage_state_path)
@@ -156,7 +281,7 @@ class ScalersSlackEngine:
                     "Browser automation is enabled but storage_state_path is missing. "
                     "Create it with Playwright or disable browser_automation."
                 )
-            self.browser_session: BrowserSession | None = BrowserSession(browser_config)
+            self.browser_session: BrowserSession | None = _BrowserSessionPool.acquire(browser_config)
         else:
             self.browser_session = None
 
@@ -165,18 +290,22 @@ class ScalersSlackEngine:
         elif slack_token:
             self.slack = SlackClient(
                 token=slack_token,
-                base_url=slack_settings["base_url"],
-                timeout=slack_timeout,
-                retry_config=slack_retries,
+                base_url=slack_settings.base_url,
+                timeout=slack_settings.timeout,
+                retry_config=slack_settings.retries,
+                http=_shared_http_session(),
             )
         elif self.browser_session:
-            self.slack = SlackBrowserClient(self.browser_session, browser_config)
+            from . import browser
+
+            self.slack = browser.SlackBrowserClient(self.browser_session, self.browser_session.config)
         else:
             self.slack = SlackClient(
                 token=slack_token,
-                base_url=slack_settings["base_url"],
-                timeout=slack_timeout,
-                retry_config=slack_retries,
+                base_url=slack_settings.base_url,
+                timeout=slack_settings.timeout,
+                retry_config=slack_settings.retries,
+                http=_shared_http_session(),
             )
 
         if notion_client:
@@ -187,16 +316,26 @@ class ScalersSlackEngine:
                 version=notion_settings["version"],
                 timeout=notion_timeout,
                 retry_config=notion_retries,
+                http=_shared_http_session(),
             )
         elif self.browser_session:
-            self.notion = NotionBrowserClient(self.browser_session, browser_config)
+            from . import browser
+
+            self.notion = browser.NotionBrowserClient(self.browser_session, self.browser_session.config)
         else:
             self.notion = NotionClient(
                 token=notion_token,
                 version=notion_settings["version"],
                 timeout=notion_timeout,
                 retry_config=notion_retries,
+                http=_shared_http_session(),
             )
+        # Optional client hooks, looked up once rather than probed on every sync.
+        self._slack_get_stats: Callable[[], Any] | None = getattr(self.slack, "get_stats", None)
+        self._slack_get_pagination_stats: Callable[[], Any] | None = getattr(self.slack, "get_pagination_stats", None)
+        self._slack_reset_stats: Callable[[], Any] | None = getattr(self.slack, "reset_stats", None)
+        self._notion_get_stats: Callable[[], Any] | None = getattr(self.notion, "get_stats", None)
+        self._notion_reset_stats: Callable[[], Any] | None = getattr(self.notion, "reset_stats", None)
         self.audit = audit_logger or AuditLogger(
             enabled=audit_settings.get("enabled", True),
             storage_dir=audit_settings.get("storage_dir", "audit"),
@@ -205,26 +344,33 @@ class ScalersSlackEngine:
         )
         self.thread_extractor = thread_extractor or ThreadExtractor(self.slack)
         self.audit_settings = audit_settings
+        self.strict_verify = coerce_bool(audit_settings.get("strict_verify"), False)
         self.slack_settings = slack_settings
         self.feature_settings = feature_settings
-        self.browser_config = browser_config
+        # First entry wins on duplicate names, matching get_project.
+        self._project_index: dict[str, dict[str, Any]] = {}
+        # Coerced pagination and feature flags per project, built on first use.
+        self._pagination_cache: dict[str, dict[str, int]] = {}
+        self._feature_cache: dict[str, dict[str, bool]] = {}
+        for project in self.config.get("projects", []):
+            self._project_index.setdefault(project.get("name"), project)
 
         # Store hub URL for Notion navigation
         self.notion_hub_url = self.config.get("settings", {}).get("notion_hub", {}).get("url", "")
 
         # Initialize cross-referencer if browser mode is active
         self.cross_referencer = None
-        if (
-            SlackNotionCrossReferencer is not None
-            and self.browser_session
-            and isinstance(self.slack, SlackBrowserClient)
-            and isinstance(self.notion, NotionBrowserClient)
-        ):
-            self.cross_referencer = SlackNotionCrossReferencer(
-                slack_client=self.slack,
-                notion_client=self.notion,
-                config=self.config,
-            )
+        if self.browser_session:
+            from . import browser
+
+            if isinstance(self.slack, browser.SlackBrowserClient) and isinstance(
+                self.notion, browser.NotionBrowserClient
+            ):
+                self.cross_referencer = browser.SlackNotionCrossReferencer(
+                    slack_client=self.slack,
+                    notion_client=self.notion,
+                    config=self.config,
+                )
 
         # Initialize BugHerd and QA bridges (separate systems, shared interfaces)
         self.bugherd_bridge = None
@@ -236,7 +382,7 @@ class ScalersSlackEngine:
                 try:
                     from .browser import BugHerdBrowserClient
 
-                    bugherd_browser = BugHerdBrowserClient(self.browser_session, browser_config)
+                    bugherd_browser = BugHerdBrowserClient(self.browser_session, self.browser_session.config)
                     self.bugherd_bridge.set_browser_client(bugherd_browser)
                     logger.info("BugHerd browser client initialized for browser mode")
                 except ImportError:
@@ -244,6 +390,25 @@ class ScalersSlackEngine:
         if QABridge is not None:
             self.qa_bridge = QABridge()
 
+    @cached_property
+    def browser_config(self) -> "BrowserAutomationConfig":
+        # Built on first access so API-token runs never import the browser package.
+        return _build_browser_config(self._browser_settings)
+
+    def _get_project(self, project_name: str) -> dict[str, Any] | None:
+        project = self._project_index.get(project_name)
+        if project is None:
+            # Fall back to a scan in case projects were added to self.config after startup.
+            project = get_project(self.config, project_name)
+        return project
+
+    def _project_features(self, project_name: str, project: dict[str, Any]) -> dict[str, bool]:
+        features = self._feature_cache.get(project_name)
+        if features is None:
+            features = {key: _effective_feature(self.feature_settings, project, key) for key in _SYNC_FEATURES}
+            self._feature_cache[project_name] = features
+        return features
+
     def run_sync(
         self,
         project_name: str,
@@ -251,19 +416,32 @@ class ScalersSlackEngine:
         query: str | None = None,
         dry_run: bool = False,
         post_to_slack: bool = False,
+    ) -> dict[str, Any] | None:
+        # Batch the run's audit records into one write; loggers without transaction() write through.
+        transaction = getattr(self.audit, "transaction", None)
+        with transaction() if transaction else nullcontext():
+            return self._run_sync(project_name, since, query, dry_run, post_to_slack)
+
+    def _run_sync(
+        self,
+        project_name: str,
+        since: str | None,
+        query: str | None,
+        dry_run: bool,
+        post_to_slack: bool,
     ) -> dict[str, Any] | None:
         run_started = time.monotonic()
-        project = get_project(self.config, project_name)
+        project = self._get_project(project_name)
         if not project:
             raise RuntimeError(f"Project '{project_name}' not found in config.json")
 
-        channel_id = project.get("slack_channel_id") or self.slack_settings.get("default_channel_id")
+        channel_id = project.get("slack_channel_id") or self.slack_settings.default_channel_id
         if not channel_id:
             raise RuntimeError("Slack channel ID is required in config.json")
 
         # Pagination and time window are handled in collect_activity based on config.
         sync_timestamp = utc_now_iso()
-        run_date = sync_timestamp.split("T")[0]
+        run_date = sync_timestamp[:10]
         run_id = make_run_id(project_name, since, query, run_date)
         run_summary: dict[str, Any] = {
             "project": project_name,
@@ -276,11 +454,12 @@ class ScalersSlackEngine:
             "status": "started",
         }
 
-        enable_audit = _effective_feature(self.feature_settings, project, "enable_audit")
-        enable_notion_audit_note = _effective_feature(self.feature_settings, project, "enable_notion_audit_note")
-        enable_notion_last_synced = _effective_feature(self.feature_settings, project, "enable_notion_last_synced")
-        enable_slack_topic_update = _effective_feature(self.feature_settings, project, "enable_slack_topic_update")
-        enable_run_id = _effective_feature(self.feature_settings, project, "enable_run_id_idempotency")
+        features = self._project_features(project_name, project)
+        enable_audit = features["enable_audit"]
+        enable_notion_audit_note = features["enable_notion_audit_note"]
+        enable_notion_last_synced = features["enable_notion_last_synced"]
+        enable_slack_topic_update = features["enable_slack_topic_update"]
+        enable_run_id = features["enable_run_id_idempotency"]
 
         # Safety gate: never write to Slack unless explicitly requested.
         slack_writes_allowed = bool(post_to_slack) and not dry_run
@@ -295,6 +474,8 @@ class ScalersSlackEngine:
                 self.audit.ensure_initialized()
 
         action = "slack_sync"
+        # Fields shared by every structured log line of this run.
+        base_log_fields: dict[str, Any] = {"project": project_name, "run_id": run_id, "json_enabled": self.json_logging}
         try:
             self.audit.log(
                 action,
@@ -305,11 +486,9 @@ class ScalersSlackEngine:
                 logger,
                 action="slack_sync",
                 status="started",
-                project=project_name,
-                run_id=run_id,
                 since=since,
                 query=query,
-                json_enabled=self.json_logging,
+                **base_log_fields,
             )
 
             skip_notion = enable_audit and enable_run_id and self.audit.has_run_id(run_id)
@@ -319,9 +498,7 @@ class ScalersSlackEngine:
                     logger,
                     action="slack_sync",
                     status="run_id_exists",
-                    project=project_name,
-                    run_id=run_id,
-                    json_enabled=self.json_logging,
+                    **base_log_fields,
                 )
 
             slack_method = "search" if query else "history"
@@ -333,8 +510,8 @@ class ScalersSlackEngine:
                 raise
 
             slack_duration_ms = int((time.monotonic() - slack_start) * 1000)
-            slack_stats = self._get_client_stats(self.slack)
-            pagination_stats = self._get_pagination_stats(self.slack)
+            slack_stats = self._collect_stats(self._slack_get_stats)
+            pagination_stats = self._collect_stats(self._slack_get_pagination_stats)
             run_summary.update(
                 {
                     "thread_count": len(threads),
@@ -348,15 +525,13 @@ class ScalersSlackEngine:
                 logger,
                 action="slack_fetch",
                 status="completed",
-                project=project_name,
-                run_id=run_id,
                 method=slack_method,
                 thread_count=len(threads),
-                sample_threads=[thread.thread_ts for thread in threads[:3]],
+                sample_threads=[thread.thread_ts for thread in islice(threads, 3)],
                 duration_ms=slack_duration_ms,
                 pagination=pagination_stats,
                 slack_stats=slack_stats,
-                json_enabled=self.json_logging,
+                **base_log_fields,
             )
             self.audit.log(
                 action,
@@ -401,17 +576,16 @@ class ScalersSlackEngine:
                     logger,
                     action="slack_sync",
                     status="dry_run",
-                    project=project_name,
-                    run_id=run_id,
                     thread_count=len(threads),
-                    json_enabled=self.json_logging,
+                    **base_log_fields,
                 )
                 return run_summary
 
+            # Writes run in order: a failed Notion write raises before the Slack topic is touched.
             notion_written = False
             if not skip_notion:
-                if hasattr(self.notion, "reset_stats"):
-                    self.notion.reset_stats()
+                if self._notion_reset_stats is not None:
+                    self._notion_reset_stats()
                 if enable_notion_audit_note and audit_note_page:
                     note_text = self._build_audit_note(project_name, sync_timestamp, threads, run_id, channel_id)
                     self._write_notion_audit_note(note_text, audit_note_page, run_id)
@@ -430,8 +604,9 @@ class ScalersSlackEngine:
                         details={"since": since, "query": query},
                     )
             run_summary["notion_written"] = notion_written
-            run_summary["notion_stats"] = self._get_client_stats(self.notion)
+            run_summary["notion_stats"] = self._collect_stats(self._notion_get_stats)
 
+            run_summary["slack_topic_updated"] = False
             if enable_slack_topic_update:
                 slack_topic_start = time.monotonic()
                 self._update_slack_last_synced(channel_id, sync_timestamp)
@@ -440,23 +615,17 @@ class ScalersSlackEngine:
                     logger,
                     action="slack_topic_update",
                     status="completed",
-                    project=project_name,
-                    run_id=run_id,
                     duration_ms=int((time.monotonic() - slack_topic_start) * 1000),
-                    json_enabled=self.json_logging,
+                    **base_log_fields,
                 )
-            else:
-                run_summary["slack_topic_updated"] = False
 
             self.audit.log(action, "completed", {"project": project_name, "threads": len(threads), "run_id": run_id})
             log_event(
                 logger,
                 action="slack_sync",
                 status="completed",
-                project=project_name,
-                run_id=run_id,
                 thread_count=len(threads),
-                json_enabled=self.json_logging,
+                **base_log_fields,
             )
             run_summary["status"] = "completed"
 
@@ -494,10 +663,12 @@ class ScalersSlackEngine:
             f"Threads collected: {len(threads)}.",
         ]
 
+        sample = threads[:5]
+        user_names = self._resolve_user_names(thread.user_id for thread in sample if thread.user_id)
         lines = []
-        for thread in threads[:5]:
+        for thread in sample:
             preview = thread.preview(100).replace("\n", " ")
-            user_name = self._resolve_user_name(thread.user_id) if thread.user_id else "unknown"
+            user_name = user_names[thread.user_id] if thread.user_id else "unknown"
             line = f"- {thread.created_at or 'unknown'} | {user_name} | {preview}"
             if thread.permalink:
                 line += f" | {thread.permalink}"
@@ -506,12 +677,14 @@ class ScalersSlackEngine:
         if not lines:
             lines.append("- No threads collected")
 
-        return "\n".join(header + ["Top threads:"] + lines)
+        return "\n".join([*header, "Top threads:", *lines])
 
     def _format_thread_preview(self, threads: list[Thread], limit: int = 5) -> list[dict[str, Any]]:
+        sample = threads[:limit]
+        user_names = self._resolve_user_names(thread.user_id for thread in sample if thread.user_id)
         preview_items = []
-        for thread in threads[:limit]:
-            user_name = self._resolve_user_name(thread.user_id) if thread.user_id else "unknown"
+        for thread in sample:
+            user_name = user_names[thread.user_id] if thread.user_id else "unknown"
             preview_items.append(
                 {
                     "thread_ts": thread.thread_ts,
@@ -551,7 +724,7 @@ class ScalersSlackEngine:
             start_time = time.monotonic()
             block_id = self.notion.append_audit_note(page_id, note_text)
             if supports_verification:
-                block = self.notion.get_block(block_id)
+                block = self._read_back(block_id, self.notion.get_block)
                 verified = self._verify_notion_block(block, note_text)
                 if not verified:
                     self.audit.log_review(
@@ -562,6 +735,7 @@ class ScalersSlackEngine:
                     return
                 self.audit.log(action, "completed", {"page_id": page_id, "block_id": block_id, "run_id": run_id})
             else:
+                self._take_write_result(block_id)
                 self.audit.log_review(
                     action,
                     {"page_id": page_id, "block_id": block_id, "run_id": run_id},
@@ -577,11 +751,11 @@ class ScalersSlackEngine:
                 page_id=page_id,
                 block_id=block_id,
                 duration_ms=duration_ms,
-                notion_stats=self._get_client_stats(self.notion),
+                notion_stats=self._collect_stats(self._notion_get_stats),
                 json_enabled=self.json_logging,
             )
         except Exception as exc:
-            if isinstance(self.notion, NotionBrowserClient):
+            if _is_browser_client(self.notion):
                 self.audit.log_review(action, {"page_id": page_id, "run_id": run_id}, error=str(exc))
                 log_event(
                     logger,
@@ -607,12 +781,46 @@ class ScalersSlackEngine:
             )
             raise
 
+    def _take_write_result(self, object_id: str) -> dict | None:
+        # Always pop, even when the response goes unused, so the client's store stays empty.
+        pop_write_result = getattr(self.notion, "pop_write_result", None)
+        return cast("dict | None", pop_write_result(object_id)) if pop_write_result else None
+
+    def _read_back(self, object_id: str, fetch: Callable[[str], dict]) -> dict:
+        # Notion echoes the written block/page in the write response; verify against that
+        # instead of a second GET unless strict_verify asks for a fresh read.
+        written = self._take_write_result(object_id)
+        if written and not self.strict_verify:
+            return written
+        return fetch(object_id)
+
     def _verify_notion_block(self, block: dict, expected_text: str) -> bool:
         if not block or block.get("type") != "paragraph":
             return False
         rich_text = block.get("paragraph", {}).get("rich_text", [])
-        text = "".join([item.get("plain_text", "") for item in rich_text])
-        return expected_text.strip() == text.strip()
+        # Equivalent to expected.strip() == "".join(plain_texts).strip(), but walks the segments
+        # in place and stops at the first mismatch instead of building the joined string.
+        expected = expected_text.strip()
+        end = len(expected)
+        pos = 0
+        started = False
+        for item in rich_text:
+            segment = item.get("plain_text", "")
+            if not started:
+                segment = segment.lstrip()
+                if not segment:
+                    continue
+                started = True
+            if pos == end:
+                if segment and not segment.isspace():
+                    return False
+            elif expected.startswith(segment, pos):
+                pos += len(segment)
+            elif expected.startswith(segment[: end - pos], pos) and segment[end - pos :].isspace():
+                pos = end
+            else:
+                return False
+        return pos == end
 
     def _update_notion_last_synced(self, page_id: str, property_name: str, sync_timestamp: str, run_id: str) -> None:
         action = "notion_last_synced"
@@ -641,6 +849,7 @@ class ScalersSlackEngine:
 
             supports_verification = getattr(self.notion, "supports_verification", True)
             if not supports_verification:
+                self._take_write_result(page_id)
                 self.audit.log(action, "completed", {"page_id": page_id, "value": sync_timestamp, "run_id": run_id})
                 log_event(
                     logger,
@@ -651,12 +860,12 @@ class ScalersSlackEngine:
                     page_id=page_id,
                     value=sync_timestamp,
                     duration_ms=int((time.monotonic() - start_time) * 1000),
-                    notion_stats=self._get_client_stats(self.notion),
+                    notion_stats=self._collect_stats(self._notion_get_stats),
                     json_enabled=self.json_logging,
                 )
                 return
 
-            page = self.notion.get_page(page_id)
+            page = self._read_back(page_id, self.notion.get_page)
             actual = self._extract_notion_date(page, property_name)
             if actual != sync_timestamp:
                 self.audit.log_review(
@@ -687,11 +896,11 @@ class ScalersSlackEngine:
                 page_id=page_id,
                 value=sync_timestamp,
                 duration_ms=duration_ms,
-                notion_stats=self._get_client_stats(self.notion),
+                notion_stats=self._collect_stats(self._notion_get_stats),
                 json_enabled=self.json_logging,
             )
         except Exception as exc:
-            if isinstance(self.notion, NotionBrowserClient):
+            if _is_browser_client(self.notion):
                 self.audit.log_review(action, {"page_id": page_id, "run_id": run_id}, error=str(exc))
                 log_event(
                     logger,
@@ -758,15 +967,9 @@ class ScalersSlackEngine:
             self._channel_cache[channel_id] = info
         return info
 
-    def _get_client_stats(self, client: object) -> dict[str, Any]:
-        if hasattr(client, "get_stats"):
-            return cast(dict[str, Any], client.get_stats())
-        return {}
-
-    def _get_pagination_stats(self, client: object) -> dict[str, Any]:
-        if hasattr(client, "get_pagination_stats"):
-            return cast(dict[str, Any], client.get_pagination_stats())
-        return {}
+    @staticmethod
+    def _collect_stats(get_stats: Callable[[], Any] | None) -> dict[str, Any]:
+        return cast(dict[str, Any], get_stats()) if get_stats is not None else {}
 
     def _resolve_user_name(self, user_id: str) -> str:
         if not user_id:
@@ -774,6 +977,27 @@ class ScalersSlackEngine:
         cached = self.audit.get_user_name(user_id)
         if cached:
             return cached
+        return self._fetch_user_name(user_id)
+
+    def _resolve_user_names(self, user_ids: Iterable[str]) -> dict[str, str]:
+        """Resolve several user ids at once, fetching cache misses in parallel when the client allows it."""
+        names: dict[str, str] = {}
+        missing: list[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            cached = self.audit.get_user_name(user_id)
+            if cached:
+                names[user_id] = cached
+            else:
+                missing.append(user_id)
+        # Browser clients drive Playwright objects bound to this thread, so they fetch one at a time.
+        if len(missing) > 1 and not _is_browser_client(self.slack):
+            with ThreadPoolExecutor(max_workers=min(5, len(missing))) as executor:
+                names.update(zip(missing, executor.map(self._fetch_user_name, missing)))
+        else:
+            names.update((user_id, self._fetch_user_name(user_id)) for user_id in missing)
+        return names
+
+    def _fetch_user_name(self, user_id: str) -> str:
         try:
             user = self.slack.get_user_info(user_id)
             real_name = user.get("real_name", "")
@@ -822,12 +1046,12 @@ class ScalersSlackEngine:
         database_ids = [db for db in [database_id, builds_db_id] if db]
 
         # Browser mode doesn't require database IDs (uses search instead)
-        is_browser_mode = isinstance(self.notion, NotionBrowserClient)
+        is_browser_mode = _is_browser_client(self.notion)
         if not database_ids and not is_browser_mode:
             return "Error: No Notion Database IDs found in ENV or config.json"
 
         # 1. Collect activity
-        project = get_project(self.config, project_name)
+        project = self._get_project(project_name)
         if not project:
             return f"Project '{project_name}' not found in config.json"
 
@@ -873,14 +1097,14 @@ class ScalersSlackEngine:
                 "error": "Cross-referencer not available (requires browser mode)",
             }
 
-        project = get_project(self.config, project_name)
+        project = self._get_project(project_name)
         if not project:
             return {
                 "status": "error",
                 "error": f"Project '{project_name}' not found in config.json",
             }
 
-        channel_id = project.get("slack_channel_id") or self.slack_settings.get("default_channel_id")
+        channel_id = project.get("slack_channel_id") or self.slack_settings.default_channel_id
         if not channel_id:
             return {
                 "status": "error",
@@ -1120,47 +1344,51 @@ class ScalersSlackEngine:
         since: str | None = None,
         query: str | None = None,
     ) -> list[Thread]:
-        project = get_project(self.config, project_name)
+        project = self._get_project(project_name)
         if not project:
             return []
 
-        channel_id = project.get("slack_channel_id") or self.slack_settings.get("default_channel_id")
+        channel_id = project.get("slack_channel_id") or self.slack_settings.default_channel_id
         if not channel_id:
             return []
 
-        pagination_defaults = self.slack_settings.get("pagination", {})
-        pagination_overrides = project.get("slack_pagination") or {}
-        pagination = {**pagination_defaults, **pagination_overrides}
-        history_limit = _coerce_int(pagination.get("history_limit"), 200)
-        history_max_pages = _coerce_int(pagination.get("history_max_pages"), 5)
-        search_limit = _coerce_int(pagination.get("search_limit"), 100)
-        search_max_pages = _coerce_int(pagination.get("search_max_pages"), 3)
+        pagination = self._pagination_cache.get(project_name)
+        if pagination is None:
+            pagination_overrides = project.get("slack_pagination")
+            if pagination_overrides:
+                pagination = _coerce_pagination(ChainMap(pagination_overrides, self.slack_settings.pagination))
+            else:
+                pagination = self.slack_settings.coerced_pagination
+            self._pagination_cache[project_name] = pagination
 
         oldest = iso_to_unix_ts(since) if since else None
 
-        if hasattr(self.slack, "reset_stats"):
-            self.slack.reset_stats()
+        if self._slack_reset_stats is not None:
+            self._slack_reset_stats()
 
         if query:
             return self.thread_extractor.search_threads(
                 query=query,
                 channel_id=channel_id,
-                limit=search_limit,
-                max_pages=search_max_pages,
+                limit=pagination["search_limit"],
+                max_pages=pagination["search_max_pages"],
             )
         else:
             return self.thread_extractor.fetch_channel_threads(
                 channel_id=channel_id,
                 oldest=oldest,
-                limit=history_limit,
-                max_pages=history_max_pages,
+                limit=pagination["history_limit"],
+                max_pages=pagination["history_max_pages"],
             )
 
     def close(self) -> None:
         if not self.browser_session:
             return
-        if self.browser_config.keep_open:
+        if self.browser_session.config.keep_open:
+            # Kept open for the next engine on this thread; the pool closes it at exit.
             logger.info("Keeping browser session open (keep_open enabled).")
+            _BrowserSessionPool.release(self.browser_session)
+            self.browser_session = None
             return
         try:
             self.browser_session.close()
@@ -1217,7 +1445,7 @@ def main() -> None:
     args = parser.parse_args()
     if args.validate_config:
         config = load_config(args.config)
-        validate_or_raise(config)
+        validate_or_raise(config, schema=True)
         logger.info("Config OK")
         # logger.info("Config OK") already logged above
         return
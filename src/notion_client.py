@@ -1,3 +1,4 @@
+import json
 import os
 import random
 import time
@@ -5,6 +6,17 @@ from typing import Any, cast
 
 import requests
 
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        return json.dumps(obj).encode("utf-8")
+
+
+def _encode_body(body: dict | None) -> bytes | None:
+    return None if body is None else _dumps(body)
+
 
 class NotionClient:
     def __init__(
@@ -13,8 +25,11 @@ class NotionClient:
         version: str = "2022-06-28",
         timeout: int = 30,
         retry_config: dict | None = None,
+        http: requests.Session | None = None,
     ):
         self.token = token or os.getenv("NOTION_API_KEY")
+        # Optional shared session for connection reuse; None sends each call via requests.request.
+        self.http = http
         self.version = version
         self.base_url = "https://api.notion.com/v1"
         self.timeout = timeout
@@ -26,6 +41,8 @@ class NotionClient:
         self.retry_on_network_error: bool = True
         self.retry_non_idempotent: bool = False
         self.stats: dict[str, Any] = {}
+        # Objects echoed back by our own writes, keyed by id, so callers can verify without a GET.
+        self._write_results: dict[str, dict] = {}
         self._configure_retries(retry_config or {})
         self.reset_stats()
 
@@ -72,15 +89,18 @@ class NotionClient:
             "Notion-Version": self.version,
             "Content-Type": "application/json",
         }
+        # Serialize once up front rather than on every retry attempt.
+        data = _encode_body(json_body)
+        send = self.http.request if self.http is not None else requests.request
         last_error: Exception | None = None
         for attempt in range(1, self.retry_max_attempts + 1):
             try:
                 self.stats["api_calls"] += 1
-                response = requests.request(
+                response = send(
                     method,
                     url,
                     headers=headers,
-                    json=json_body,
+                    data=data,
                     timeout=self.timeout,
                 )
             except requests.exceptions.RequestException as exc:
@@ -148,14 +168,20 @@ class NotionClient:
         results = data.get("results", [])
         if not results:
             raise RuntimeError("Notion did not return a block for the audit note")
-        return cast(str, results[0]["id"])
+        block_id = cast(str, results[0]["id"])
+        self._write_results[block_id] = results[0]
+        return block_id
 
     def get_block(self, block_id: str) -> dict:
         return self._request("GET", f"blocks/{block_id}")
 
     def update_page_property(self, page_id: str, property_name: str, date_iso: str) -> None:
         payload = {"properties": {property_name: {"date": {"start": date_iso}}}}
-        self._request("PATCH", f"pages/{page_id}", json_body=payload, idempotent=True)
+        self._write_results[page_id] = self._request("PATCH", f"pages/{page_id}", json_body=payload, idempotent=True)
+
+    def pop_write_result(self, object_id: str) -> dict | None:
+        """Return (once) the object Notion sent back when we last wrote ``object_id``."""
+        return self._write_results.pop(object_id, None)
 
     def get_page(self, page_id: str) -> dict:
         return self._request("GET", f"pages/{page_id}")
@@ -13,8 +13,11 @@ class SlackClient:
         base_url: str = "https://slack.com/api",
         timeout: int = 30,
         retry_config: dict | None = None,
+        http: requests.Session | None = None,
     ):
         self.token = token or os.getenv("SLACK_BOT_TOKEN")
+        # Optional shared session for connection reuse; None sends each call via requests.request.
+        self.http = http
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retry_max_attempts: int = 5
@@ -70,11 +73,12 @@ class SlackClient:
             "Content-Type": "application/json; charset=utf-8",
         }
 
+        send = self.http.request if self.http is not None else requests.request
         last_error: Exception | None = None
         for attempt in range(1, self.retry_max_attempts + 1):
             try:
                 self.stats["api_calls"] += 1
-                response = requests.request(
+                response = send(
                     method,
                     url,
                     headers=headers,
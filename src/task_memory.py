@@ -153,6 +153,8 @@ class TaskMemory:
         """
         self.memory_path = memory_path or self.DEFAULT_MEMORY_PATH
         self.data: Dict[str, Any] = self._get_default_data()
+        # Bumped on every load and save so readers can tell when cached views are stale.
+        self.revision = 0
         self.load()
 
     def _get_default_data(self) -> Dict[str, Any]:
@@ -177,6 +179,7 @@ class TaskMemory:
 
     def load(self) -> None:
         """Load memory from disk."""
+        self.revision += 1
         if not os.path.exists(self.memory_path):
             os.makedirs(os.path.dirname(self.memory_path), exist_ok=True)
             self.save()
@@ -195,6 +198,7 @@ class TaskMemory:
 
     def save(self) -> None:
         """Save memory to disk."""
+        self.revision += 1
         try:
             self.data["metadata"]["updated_at"] = datetime.now().isoformat()
             os.makedirs(os.path.dirname(self.memory_path), exist_ok=True)
@@ -388,6 +392,29 @@ class TaskMemory:
                 tasks.append(TaskRecord.from_dict(task_data))
         return tasks
 
+    def get_tasks_grouped_by_assignee(self, assignees: List[str]) -> Dict[str, List[TaskRecord]]:
+        """
+        Get tasks for several assignees in a single pass over the store.
+
+        Args:
+            assignees: Names to collect tasks for (matched case-insensitively)
+
+        Returns:
+            Mapping of each requested name to its list of TaskRecord objects
+        """
+        grouped: Dict[str, List[TaskRecord]] = {name: [] for name in assignees}
+        by_lower: Dict[str, List[List[TaskRecord]]] = {}
+        for name, bucket in grouped.items():
+            by_lower.setdefault(name.lower(), []).append(bucket)
+
+        for task_data in self.data["tasks"].values():
+            targets = by_lower.get(task_data["assignee"].lower())
+            if targets:
+                task = TaskRecord.from_dict(task_data)
+                for target in targets:
+                    target.append(task)
+        return grouped
+
     def get_incomplete_tasks(self, assignee: Optional[str] = None) -> List[TaskRecord]:
         """Get all incomplete tasks, optionally filtered by assignee."""
         tasks = []
@@ -1,6 +1,6 @@
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Any, Protocol
+from typing import Any, Iterable, Protocol
 
 from .models import Thread
 
@@ -30,17 +30,10 @@ class ThreadExtractor:
         max_pages: int = 5,
     ) -> list[Thread]:
         matches = self.slack_client.search_messages_paginated(query=query, count=limit, max_pages=max_pages)
-        threads = defaultdict(list)
-
-        for match in matches:
-            if channel_id and match.get("channel", {}).get("id") != channel_id:
-                continue
-            thread_ts = match.get("thread_ts") or match.get("ts")
-            if not thread_ts:
-                continue
-            threads[thread_ts].append(match)
-
-        return [self._summarize_thread(thread_ts, items) for thread_ts, items in threads.items()]
+        if channel_id:
+            matches = [match for match in matches if match.get("channel", {}).get("id") == channel_id]
+        threads = self._group_by_thread(matches)
+        return [self._summarize_thread(thread_ts, first, count) for thread_ts, (first, count) in threads.items()]
 
     def fetch_channel_threads(
         self,
@@ -57,27 +50,30 @@ class ThreadExtractor:
             limit=limit,
             max_pages=max_pages,
         )
-        threads = defaultdict(list)
+        threads = self._group_by_thread(messages)
+        return [
+            self._summarize_thread(thread_ts, first, count, channel_id=channel_id)
+            for thread_ts, (first, count) in threads.items()
+        ]
+
+    @staticmethod
+    def _group_by_thread(messages: Iterable[dict[str, Any]]) -> dict[str, tuple[dict[str, Any], int]]:
+        """Map thread_ts to (first message, message count).
+
+        A summary only reads the first message and the count, so groups keep just those
+        rather than a list of every message in the thread.
+        """
+        firsts: dict[str, dict[str, Any]] = {}
+        counts: Counter[str] = Counter()
         for message in messages:
             thread_ts = message.get("thread_ts") or message.get("ts")
             if not thread_ts:
                 continue
-            threads[thread_ts].append(message)
-
-        return [self._summarize_thread(thread_ts, items, channel_id=channel_id) for thread_ts, items in threads.items()]
+            firsts.setdefault(thread_ts, message)
+            counts[thread_ts] += 1
+        return {thread_ts: (first, counts[thread_ts]) for thread_ts, first in firsts.items()}
 
-    def _summarize_thread(self, thread_ts: str, items: list[dict], channel_id: str | None = None) -> Thread:
-        if not items:
-            return Thread(
-                thread_ts=thread_ts,
-                channel_id=channel_id,
-                message_count=0,
-                text="",
-                created_at=None,
-                reply_count=None,
-                permalink=None,
-            )
-        first = items[0]
+    def _summarize_thread(self, thread_ts: str, first: dict, count: int, channel_id: str | None = None) -> Thread:
         created_at = None
         try:
             ts_float = float(thread_ts)
@@ -86,14 +82,14 @@ class ThreadExtractor:
             created_at = None
         channel = first.get("channel", {}).get("id") or first.get("channel_id") or channel_id
         reply_count = first.get("reply_count")
-        if reply_count is None and len(items) > 1:
-            reply_count = max(len(items) - 1, 0)
+        if reply_count is None and count > 1:
+            reply_count = count - 1
 
         return Thread(
             thread_ts=thread_ts,
             channel_id=channel,
             user_id=first.get("user"),
-            message_count=len(items),
+            message_count=count,
             text=first.get("text") or "",
             created_at=created_at,
             reply_count=reply_count,
@@ -1,4 +1,6 @@
+import functools
 import hashlib
+import time
 from datetime import datetime, timezone
 
 
@@ -8,9 +10,30 @@ def iso_to_unix_ts(iso_value: str) -> str:
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # Same output as datetime.now(timezone.utc).replace(microsecond=0).isoformat(), at about half the cost;
+    # this runs for every structured log line.
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
 
 
 def make_run_id(project: str, since: str | None, query: str | None, run_date: str) -> str:
     payload = "|".join([project or "", since or "", query or "", run_date or ""])
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Strings treated as true in config flags, after stripping and lower-casing.
+_TRUTHY = frozenset({"true", "1", "yes", "y"})
+
+
+@functools.lru_cache(maxsize=256)
+def _coerce_bool_str(value: str) -> bool:
+    return value.strip().lower() in _TRUTHY
+
+
+def coerce_bool(value: object, default: bool) -> bool:
+    if type(value) is bool:
+        return value
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return _coerce_bool_str(value)
+    return bool(value)
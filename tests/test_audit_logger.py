@@ -1,6 +1,8 @@
 import os
+import sqlite3
 import tempfile
 import unittest
+from unittest import mock
 
 from src.audit_logger import AuditLogger
 
@@ -21,6 +23,53 @@ class AuditLoggerRunIdTests(unittest.TestCase):
             logger.record_run_id(run_id, "demo", status="notion_written")
             self.assertTrue(logger.has_run_id(run_id))
 
+    def test_known_run_id_skips_registry_query(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = AuditLogger(
+                enabled=True,
+                storage_dir=tmpdir,
+                sqlite_path=os.path.join(tmpdir, "audit.db"),
+                jsonl_path=os.path.join(tmpdir, "audit.jsonl"),
+            )
+            logger.record_run_id("run-123", "demo")
+            reader = AuditLogger(
+                enabled=True,
+                storage_dir=tmpdir,
+                sqlite_path=logger.sqlite_path,
+                jsonl_path=logger.jsonl_path,
+            )
+            self.assertTrue(reader.has_run_id("run-123"))
+
+            with mock.patch("sqlite3.connect", side_effect=AssertionError("unexpected query")):
+                self.assertTrue(logger.has_run_id("run-123"))
+                self.assertTrue(reader.has_run_id("run-123"))
+
+
+class AuditLoggerTransactionTests(unittest.TestCase):
+    def test_transaction_writes_buffered_records_on_exit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = AuditLogger(
+                enabled=True,
+                storage_dir=tmpdir,
+                sqlite_path=os.path.join(tmpdir, "audit.db"),
+                jsonl_path=os.path.join(tmpdir, "audit.jsonl"),
+            )
+
+            def statuses():
+                with sqlite3.connect(logger.sqlite_path) as connection:
+                    return [row[0] for row in connection.execute("SELECT status FROM audit_log ORDER BY id")]
+
+            with logger.transaction():
+                logger.log("sync", "started")
+                with logger.transaction():
+                    logger.log("sync", "threads_collected")
+                self.assertEqual(statuses(), [])
+                logger.log_failure("notion", error="boom")
+                self.assertEqual(statuses(), ["started", "threads_collected", "failed"])
+                logger.log("sync", "completed")
+
+            self.assertEqual(statuses(), ["started", "threads_collected", "failed", "completed"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -139,6 +139,33 @@ def test_slack_api_call_retries_on_auth_error(mock_browser_session, browser_conf
         assert refresh_mock.called
 
 
+def test_slack_api_call_backs_off_on_429_without_retry_after(mock_browser_session, browser_config):
+    """A 429 with no Retry-After header sleeps with exponential backoff and then retries."""
+    slack_client = SlackBrowserClient(mock_browser_session, browser_config)
+
+    mock_request = MagicMock()
+    limited = MagicMock()
+    limited.status = 429
+    limited.headers = {}
+    limited.json.return_value = {"ok": False, "error": "ratelimited"}
+    ok = MagicMock()
+    ok.status = 200
+    ok.json.return_value = {"ok": True, "messages": []}
+    mock_request.get.side_effect = [limited, limited, ok]
+
+    with (
+        patch.object(slack_client, "_get_web_token", return_value="token"),
+        patch.object(slack_client.session, "request", return_value=mock_request),
+        patch("src.browser.slack_client.random.uniform", return_value=0.0),
+        patch("src.browser.slack_client.time.sleep") as sleep_mock,
+    ):
+        result = slack_client._slack_api_call("conversations.history", params={"channel": "C123456"})
+
+    assert result == {"ok": True, "messages": []}
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [0.5, 1.0]
+    assert slack_client.stats["rate_limit_hits"] == 2
+
+
 def test_notion_append_audit_note(mock_browser_session, browser_config):
     """Test appending an audit note to a Notion page."""
     notion_client = NotionBrowserClient(mock_browser_session, browser_config)
@@ -554,3 +581,37 @@ def test_log_event_without_directory():
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+def test_enhanced_client_resolves_prefixed_name_from_prewarm_sweep(mock_browser_session, browser_config):
+    """Names loaded by the prewarm sweep resolve with or without '#' and misses skip a second list walk."""
+    from src.deprecated.enhanced_browser_automation import EnhancedSlackBrowserClient
+
+    slack_client = EnhancedSlackBrowserClient(mock_browser_session, browser_config)
+    page = {"channels": [{"name": "random", "id": "C0123ABCDE"}, {"name": "general", "id": "C0123ABCDF"}]}
+
+    with (
+        patch.object(slack_client, "_slack_api_call", return_value=page) as api_call,
+        patch.object(slack_client, "_resolve_via_browser_navigation", return_value=None) as navigate,
+    ):
+        assert slack_client.resolve_channel_id("random") == "C0123ABCDE"
+        assert slack_client.resolve_channel_id("#general") == "C0123ABCDF"
+        assert slack_client.resolve_channel_id("#missing") is None
+        assert slack_client.resolve_channel_id("missing") is None
+
+    assert [call.args[0] for call in api_call.call_args_list] == ["conversations.list"]
+    navigate.assert_called_once_with("#missing")
+
+
+def test_enhanced_client_retries_failed_prewarm_sweep(mock_browser_session, browser_config):
+    """A sweep that fails is not recorded as warm, so the next miss sweeps again."""
+    from src.deprecated.enhanced_browser_automation import EnhancedSlackBrowserClient
+
+    slack_client = EnhancedSlackBrowserClient(mock_browser_session, browser_config)
+    page = {"channels": [{"name": "random", "id": "C0123ABCDE"}]}
+
+    with patch.object(slack_client, "_slack_api_call", side_effect=[RuntimeError("ratelimited"), page]):
+        with patch.object(slack_client, "_resolve_via_conversations_list", return_value=None):
+            with patch.object(slack_client, "_resolve_via_browser_navigation", return_value=None):
+                assert slack_client.resolve_channel_id("other") is None
+        assert slack_client.resolve_channel_id("#random") == "C0123ABCDE"
@@ -98,6 +98,17 @@ def test_slack_snapshot_legacy_uses_fallback_selectors(snapshot_page):
     assert first["text"] == "Legacy channel message one"
 
 
+def test_slack_snapshot_extract_all_messages_matches_per_element(snapshot_page):
+    snapshot_page.set_content(_fixture_html("slack_channel_legacy.html"))
+    extractor = DOMExtractor(snapshot_page)
+
+    elements = snapshot_page.locator(MESSAGE_CONTAINER.fallbacks[0]).all()
+    messages = extractor.extract_all_messages()
+
+    assert messages == [extractor.extract_message_data(element) for element in elements]
+    assert [message["user"] for message in messages] == ["Carlos", "Dina"]
+
+
 def test_slack_thread_snapshot_collects_api_like_replies(snapshot_page):
     snapshot_page.set_content(_fixture_html("slack_thread_legacy.html"))
     client = _slack_client_for_snapshot()
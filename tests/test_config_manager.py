@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from src.config_manager import ConfigManager, _cached_config_manager, get_config_manager
+
+
+class ConfigManagerTests(unittest.TestCase):
+    def setUp(self):
+        _cached_config_manager.cache_clear()
+        self.addCleanup(_cached_config_manager.cache_clear)
+
+    def test_default_path_spellings_share_one_manager(self):
+        manager = get_config_manager()
+        self.assertIs(get_config_manager(ConfigManager.DEFAULT_CONFIG_PATH), manager)
+        self.assertIs(get_config_manager("./" + ConfigManager.DEFAULT_CONFIG_PATH), manager)
+
+    def test_merge_with_args_leaves_shared_config_untouched(self):
+        manager = get_config_manager()
+        baseline = manager.load()
+        channels = list(baseline.channels)
+        actionable_only = baseline.filtering.actionable_only
+        cache_enabled = baseline.cache.enabled
+
+        merged = manager.merge_with_args(SimpleNamespace(channels="alpha, beta", actionable_only=True, no_cache=True))
+
+        self.assertEqual(merged.channels, ["alpha", "beta"])
+        self.assertTrue(merged.filtering.actionable_only)
+        self.assertIs(get_config_manager().load(), baseline)
+        self.assertEqual(baseline.channels, channels)
+        self.assertEqual(baseline.filtering.actionable_only, actionable_only)
+        self.assertEqual(baseline.cache.enabled, cache_enabled)
+
+    def _load(self, data):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "daily_report.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            return ConfigManager(path).load()
+
+    def test_unknown_keys_are_ignored_on_load(self):
+        config = self._load(
+            {
+                "_comment": "team channels",
+                "channels": ["standup"],
+                "team_members": ["Alice"],
+                "cache": {"ttl_seconds": 60, "note": "short"},
+            }
+        )
+
+        self.assertEqual(config.channels, ["standup"])
+        self.assertEqual(config.team_members, ["Alice"])
+        self.assertEqual(config.cache.ttl_seconds, 60)
+
+    def test_wrong_types_fall_back_to_defaults(self):
+        config = self._load({"channels": ["standup"], "cache": {"ttl_seconds": "soon"}})
+
+        self.assertEqual(config.channels, [])
+        self.assertEqual(config.cache.ttl_seconds, 3600)
+
+
+if __name__ == "__main__":
+    unittest.main()
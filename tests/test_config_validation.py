@@ -1,6 +1,15 @@
+import json
 import unittest
+from pathlib import Path
 
-from src.config_validation import validate_config, validate_team_channels_config
+from src.config_loader import _extract_notion_id
+from src.config_validation import (
+    _extract_notion_page_id,
+    validate_config,
+    validate_daily_report_config,
+    validate_team_channels_config,
+)
+from src.engine import _effective_feature
 
 
 class ConfigValidationTests(unittest.TestCase):
@@ -42,6 +51,16 @@ class ConfigValidationTests(unittest.TestCase):
         errors = validate_config(config)
         self.assertFalse(any("notion" in err for err in errors))
 
+    def test_string_feature_flags_are_stripped_like_the_engine(self):
+        projects = [
+            {"name": "on", "slack_channel_id": "C012345678", "enable_notion_audit_note": " Yes "},
+            {"name": "off", "slack_channel_id": "C012345679", "enable_notion_audit_note": " no\n"},
+        ]
+        config = {"settings": {"features": {"enable_notion_last_synced": False}, "audit": {}}, "projects": projects}
+
+        self.assertEqual(validate_config(config, schema=False), ["project 'on' missing notion_audit_page_id"])
+        self.assertEqual([_effective_feature({}, p, "enable_notion_audit_note") for p in projects], [True, False])
+
     def test_notion_page_url_validation(self):
         config = {
             "settings": {
@@ -65,6 +84,21 @@ class ConfigValidationTests(unittest.TestCase):
         self.assertTrue(any("project 'bad' has invalid notion_page_url" in err for err in errors))
         self.assertFalse(any("project 'demo' has invalid notion_page_url" in err for err in errors))
 
+    def test_notion_id_extraction_prefers_dashed_ids(self):
+        raw = "0123456789abcdef0123456789abcdef"
+        dashed = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+        cases = {
+            raw: raw,
+            dashed: dashed.replace("-", ""),
+            f"https://www.notion.so/Page-{raw}?p={dashed}": dashed.replace("-", ""),
+            f"https://www.notion.so/{dashed}/Page-{raw}": dashed.replace("-", ""),
+            "https://www.notion.so/Example-Page-invalid": None,
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(_extract_notion_page_id(value), expected)
+                self.assertEqual(_extract_notion_id(value), expected)
+
     def test_strict_schema_rejects_unknown_settings_key(self):
         config = {
             "settings": {
@@ -99,6 +133,51 @@ class ConfigValidationTests(unittest.TestCase):
         errors = validate_team_channels_config(team_channels)
         self.assertTrue(any("unknown team member 'Bob'" in err for err in errors))
 
+    def test_schema_skipped_when_startup_validation_disabled(self):
+        config = {
+            "settings": {
+                "validate_config_on_startup": False,
+                "features": {"enable_notion_audit_note": False, "enable_notion_last_synced": False},
+                "audit": {},
+                "unexpected_section": {},
+            },
+            "projects": [
+                {"name": "dup", "slack_channel_id": "C012345678"},
+                {"name": "dup", "slack_channel_id": "C012345679"},
+            ],
+        }
+        errors = validate_config(config)
+        self.assertFalse(any("config schema" in err for err in errors))
+        self.assertTrue(any("project.name must be unique" in err for err in errors))
+        self.assertTrue(any("config schema" in err for err in validate_config(config, schema=True)))
+
+    def test_pagination_checked_once(self):
+        config = {
+            "settings": {
+                "features": {"enable_notion_audit_note": False, "enable_notion_last_synced": False},
+                "audit": {},
+            },
+            "projects": [
+                {"name": "demo", "slack_channel_id": "C012345678", "slack_pagination": {"history_limit": 0}},
+            ],
+        }
+        errors = validate_config(config)
+        self.assertEqual(len([err for err in errors if "history_limit" in err]), 1)
+        errors = validate_config(config, schema=False)
+        self.assertIn("project 'demo' slack_pagination.history_limit must be > 0", errors)
+
+    def test_non_dict_config_reports_schema_error_only(self):
+        self.assertEqual(validate_config([]), ["config schema at (root): [] is not of type 'object'"])
+        self.assertEqual(validate_config([], schema=False), [])
+
+    def test_daily_report_validation_rejects_bad_types(self):
+        errors = validate_daily_report_config({"cache": {"ttl_seconds": "soon"}, "channels": ["standup"]})
+        self.assertTrue(any("cache.ttl_seconds" in err for err in errors))
+
+    def test_daily_report_validation_accepts_defaults_file(self):
+        data = json.loads(Path("config/daily_report_defaults.json").read_text(encoding="utf-8"))
+        self.assertEqual(validate_daily_report_config(data), [])
+
 
 if __name__ == "__main__":
     unittest.main()
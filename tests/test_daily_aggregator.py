@@ -0,0 +1,141 @@
+"""Tests for daily aggregator behavior."""
+
+import json
+from datetime import datetime
+
+from src.channel_manager import ChannelManager
+from src.daily_aggregator import DailyAggregator
+from src.task_memory import TaskMemory
+
+
+def _make_aggregator(tmp_path):
+    memory = TaskMemory(str(tmp_path / "task_memory.json"))
+    channels = ChannelManager(str(tmp_path / "missing_team_channels.json"))
+    return DailyAggregator(task_memory=memory, channel_manager=channels)
+
+
+def test_get_priority_tasks_orders_buckets_and_skips_completed(tmp_path):
+    """In-progress tasks come first, then open high priority, then open tasks due today."""
+    aggregator = _make_aggregator(tmp_path)
+    today = datetime.now().strftime("%Y-%m-%d")
+    memory = aggregator.memory
+
+    memory.add_task("Due today", "Alice", due_date=today)
+    memory.add_task("Urgent fix", "Alice", priority="high")
+    memory.add_task("Active work", "Alice", status="in_progress", priority="high")
+    memory.add_task("Done high", "Alice", status="complete", priority="high")
+    memory.add_task("Someone else", "Bob", status="in_progress")
+
+    tasks = aggregator.get_priority_tasks("Alice")
+
+    assert [t["name"] for t in tasks] == ["Active work", "Urgent fix", "Due today"]
+    assert [t["reason"] for t in tasks] == ["Currently working on", "High priority", "Due today"]
+    assert aggregator.get_priority_tasks("Alice", limit=1)[0]["name"] == "Active work"
+
+
+def test_daily_summary_is_cached_until_memory_changes(tmp_path):
+    """Repeated summaries are served from cache; a TaskMemory write or invalidate() forces a rebuild."""
+    aggregator = _make_aggregator(tmp_path)
+    aggregator.memory.add_task("First", "Alice")
+
+    summary = aggregator.get_daily_summary("Alice", "2026-01-05")
+    summary["pending_tasks"].clear()
+    cached = aggregator.get_daily_summary("Alice", "2026-01-05")
+    assert [t["name"] for t in cached["pending_tasks"]] == ["First"]
+
+    aggregator.memory.add_task("Second", "Alice")
+    fresh = aggregator.get_daily_summary("Alice", "2026-01-05")
+    assert [t["name"] for t in fresh["pending_tasks"]] == ["First", "Second"]
+    assert [t["name"] for t in aggregator.get_priority_tasks("Alice")] == []
+
+    aggregator.memory.add_task("Urgent", "Alice", priority="high")
+    assert [t["name"] for t in aggregator.get_priority_tasks("Alice")] == ["Urgent"]
+
+    aggregator.invalidate("Alice")
+    assert not aggregator._summary_cache and not aggregator._priority_cache
+
+
+def test_supplied_tasks_bypass_cache(tmp_path):
+    """Summaries built from a caller's task index are neither read from nor stored in the cache."""
+    aggregator = _make_aggregator(tmp_path)
+    aggregator.memory.add_task("First", "Alice")
+    aggregator.get_daily_summary("Alice", "2026-01-05")
+
+    summary = aggregator.get_daily_summary("Alice", "2026-01-05", tasks={})
+    assert summary["task_counts"]["total"] == 0
+    assert aggregator.get_priority_tasks("Alice", tasks={}) == []
+
+    cached = aggregator.get_daily_summary("Alice", "2026-01-05")
+    assert [t["name"] for t in cached["pending_tasks"]] == ["First"]
+
+
+def test_cache_disabled_with_zero_ttl(tmp_path):
+    """A zero TTL always recomputes."""
+    aggregator = _make_aggregator(tmp_path)
+    aggregator.cache_ttl_seconds = 0
+    aggregator.memory.add_task("First", "Alice")
+    assert aggregator.get_daily_summary("Alice")["task_counts"]["pending"] == 1
+    aggregator.memory.add_task("Second", "Alice")
+    assert aggregator.get_daily_summary("Alice")["task_counts"]["pending"] == 2
+
+
+def test_team_overview_ranks_priorities_from_summary(tmp_path):
+    """Team overview totals and top priorities match the per-member views."""
+    config_path = tmp_path / "team_channels.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "team_members": {
+                    "Alice": {"client_channels": [{"channel": "client-a", "priority": "high"}]},
+                    "Bob": {"client_channels": []},
+                },
+                "shared_channels": {"channels": {}},
+                "channel_categories": {},
+                "thread_patterns": {
+                    "completion_indicators": ["done"],
+                    "blocker_indicators": ["blocked"],
+                    "question_indicators": ["?"],
+                    "urgent_indicators": ["asap"],
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    memory = TaskMemory(str(tmp_path / "task_memory.json"))
+    aggregator = DailyAggregator(task_memory=memory, channel_manager=ChannelManager(str(config_path)))
+    memory.add_task("Urgent fix", "Alice", priority="high", status="blocked")
+    memory.add_task("Active work", "Alice", status="in_progress")
+    memory.add_task("Shipped", "Bob", status="complete")
+
+    overview = aggregator.get_team_overview()
+
+    assert overview["totals"] == {"pending": 1, "in_progress": 1, "completed": 1, "standups_posted": 0}
+    alice = overview["team_members"]["Alice"]
+    assert alice["top_priorities"] == aggregator.get_priority_tasks("Alice", limit=3)
+    assert [t["status"] for t in alice["top_priorities"]] == ["in_progress", "blocked"]
+
+
+def test_daily_summary_skips_sections_not_included(tmp_path):
+    """Excluded sections are returned empty and cached separately from full summaries."""
+    aggregator = _make_aggregator(tmp_path)
+    aggregator.memory.add_task("First", "Alice")
+
+    partial = aggregator.get_daily_summary("Alice", "2026-01-05", include=frozenset({"standup"}))
+    assert partial["task_counts"]["total"] == 0
+    assert partial["channels_to_check"] == []
+
+    full = aggregator.get_daily_summary("Alice", "2026-01-05")
+    assert [t["name"] for t in full["pending_tasks"]] == ["First"]
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    """The summary cache never grows past MAX_CACHE_ENTRIES."""
+    aggregator = _make_aggregator(tmp_path)
+    aggregator.MAX_CACHE_ENTRIES = 2
+
+    aggregator.get_daily_summary("Alice", "2026-01-05")
+    aggregator.get_daily_summary("Bob", "2026-01-05")
+    aggregator.get_daily_summary("Alice", "2026-01-05")
+    aggregator.get_daily_summary("Carol", "2026-01-05")
+
+    assert [key[0] for key in aggregator._summary_cache] == ["Alice", "Carol"]
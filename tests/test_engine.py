@@ -1,16 +1,24 @@
 import json
 import os
+import subprocess
+import sys
 import tempfile
+import threading
 import unittest
+from unittest import mock
 
-from src.engine import ScalersSlackEngine
+from src.config_loader import load_config
+from src.engine import ScalersSlackEngine, _BrowserSessionPool
 from src.models import Thread
+from src.notion_client import NotionClient
+from src.project_memory import ProjectMemory
 
 
 class StubAuditLogger:
     def __init__(self):
         self.records = []
         self.run_ids = set()
+        self.user_names = {}
         self.enabled = True
 
     def log(self, action, status, details=None, error=None):
@@ -25,6 +33,12 @@ class StubAuditLogger:
     def has_run_id(self, run_id):
         return run_id in self.run_ids
 
+    def get_user_name(self, user_id):
+        return self.user_names.get(user_id)
+
+    def set_user_name(self, user_id, real_name, display_name):
+        self.user_names[user_id] = real_name or display_name
+
     def record_run_id(self, run_id, project, status="completed", details=None):
         self.run_ids.add(run_id)
         self.log("run_registry", status, details={"run_id": run_id, "project": project})
@@ -37,6 +51,7 @@ class StubThreadExtractor:
 
     def fetch_channel_threads(self, channel_id, oldest=None, latest=None, limit=200, max_pages=10):
         self.called = True
+        self.last_page_args = (limit, max_pages)
         return self.threads
 
     def search_threads(self, query, channel_id=None, limit=100, max_pages=5):
@@ -44,6 +59,44 @@ class StubThreadExtractor:
         return self.threads
 
 
+class StubNotionClient:
+    supports_verification = False
+
+    def __init__(self):
+        self.written = []
+
+    def append_audit_note(self, page_id, text):
+        self.written.append(("note", page_id))
+        return "block-1"
+
+    def update_page_property(self, page_id, property_name, value):
+        self.written.append(("property", page_id))
+
+
+class FailingNotionClient(StubNotionClient):
+    def append_audit_note(self, page_id, text):
+        raise RuntimeError("notion_down")
+
+
+class RecordingTopicSlackClient:
+    def __init__(self):
+        self.topics = []
+
+    def get_channel_info(self, channel_id):
+        return {"id": channel_id, "name": "demo"}
+
+    def update_channel_topic(self, channel_id, topic):
+        self.topics.append((channel_id, topic))
+
+
+class FailingTopicSlackClient:
+    def get_channel_info(self, channel_id):
+        return {"id": channel_id, "name": "demo"}
+
+    def update_channel_topic(self, channel_id, topic):
+        raise RuntimeError("missing_scope")
+
+
 class EngineDryRunTests(unittest.TestCase):
     def test_run_sync_dry_run(self):
         config = {
@@ -102,6 +155,244 @@ class EngineDryRunTests(unittest.TestCase):
             self.assertIsNotNone(summary)
             self.assertEqual(summary["status"], "dry_run")
 
+    def test_engine_import_does_not_load_browser_package(self):
+        code = "import sys, src.engine; sys.exit('src.browser' in sys.modules)"
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=repo_root)
+        self.assertEqual(result.returncode, 0)
+
+    def _browser_config(self, **overrides):
+        config = load_config("missing-config.json")
+        config["settings"]["validate_config_on_startup"] = False
+        config["settings"]["browser_automation"].update({"enabled": True, "storage_state_path": "", **overrides})
+        return config
+
+    def _browser_engine(self, config):
+        with mock.patch.dict(os.environ, {"SLACK_BOT_TOKEN": "", "NOTION_API_KEY": ""}):
+            return ScalersSlackEngine(config=config, audit_logger=StubAuditLogger())
+
+    def test_keep_open_browser_session_reused_after_close(self):
+        config = self._browser_config(keep_open=True)
+        self.addCleanup(_BrowserSessionPool.close_all)
+
+        first = self._browser_engine(config)
+        session = first.browser_session
+        first.close()
+        second = self._browser_engine(config)
+
+        self.assertIsNotNone(session)
+        self.assertIsNone(first.browser_session)
+        self.assertIs(second.browser_session, session)
+
+    def test_browser_session_closed_without_keep_open(self):
+        config = self._browser_config()
+        first = self._browser_engine(config)
+        session = first.browser_session
+        with mock.patch.object(session, "close") as close:
+            first.close()
+        second = self._browser_engine(config)
+
+        close.assert_called_once_with()
+        self.assertIsNot(second.browser_session, session)
+
+    def test_pooled_browser_session_not_shared_across_threads(self):
+        config = self._browser_config(keep_open=True)
+        self.addCleanup(_BrowserSessionPool.close_all)
+        pooled = []
+
+        def open_and_close():
+            engine = self._browser_engine(config)
+            pooled.append(engine.browser_session)
+            engine.close()
+
+        worker = threading.Thread(target=open_and_close)
+        worker.start()
+        worker.join()
+        engine = self._browser_engine(config)
+
+        self.assertIsNot(engine.browser_session, pooled[0])
+        self.assertFalse(any(key[1] is worker for key in _BrowserSessionPool._idle))
+
+    def test_run_sync_records_notion_writes_when_slack_topic_fails(self):
+        config = load_config("missing-config.json")
+        config["settings"]["validate_config_on_startup"] = False
+        config["settings"]["logging"]["run_report_dir"] = ""
+        config["projects"] = [
+            {
+                "name": "demo",
+                "slack_channel_id": "C123",
+                "notion_audit_page_id": "page-note",
+                "notion_last_synced_page_id": "page-synced",
+            }
+        ]
+        notion = StubNotionClient()
+        audit_logger = StubAuditLogger()
+        engine = ScalersSlackEngine(
+            config=config,
+            slack_client=FailingTopicSlackClient(),
+            notion_client=notion,
+            audit_logger=audit_logger,
+            thread_extractor=StubThreadExtractor([]),
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            engine.memory = ProjectMemory(os.path.join(tmpdir, "memory.json"))
+            with self.assertRaisesRegex(RuntimeError, "missing_scope"):
+                engine.run_sync(project_name="demo", post_to_slack=True)
+
+        self.assertEqual(notion.written, [("note", "page-note"), ("property", "page-synced")])
+        self.assertEqual(len(audit_logger.run_ids), 1)
+        self.assertTrue(engine.last_run_summary["notion_written"])
+        self.assertFalse(engine.last_run_summary["slack_topic_updated"])
+
+    def test_run_sync_skips_slack_topic_when_notion_write_fails(self):
+        config = load_config("missing-config.json")
+        config["settings"]["validate_config_on_startup"] = False
+        config["settings"]["logging"]["run_report_dir"] = ""
+        config["projects"] = [
+            {
+                "name": "demo",
+                "slack_channel_id": "C123",
+                "notion_audit_page_id": "page-note",
+                "notion_last_synced_page_id": "page-synced",
+            }
+        ]
+        notion = FailingNotionClient()
+        slack = RecordingTopicSlackClient()
+        audit_logger = StubAuditLogger()
+        engine = ScalersSlackEngine(
+            config=config,
+            slack_client=slack,
+            notion_client=notion,
+            audit_logger=audit_logger,
+            thread_extractor=StubThreadExtractor([]),
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            engine.memory = ProjectMemory(os.path.join(tmpdir, "memory.json"))
+            with self.assertRaisesRegex(RuntimeError, "notion_down"):
+                engine.run_sync(project_name="demo", post_to_slack=True)
+
+        self.assertEqual(slack.topics, [])
+        self.assertEqual(notion.written, [])
+        self.assertEqual(audit_logger.run_ids, set())
+        self.assertEqual(engine.last_run_summary["status"], "failed")
+
+    def test_notion_writes_verified_from_write_response_unless_strict(self):
+        block = {
+            "id": "block-1",
+            "type": "paragraph",
+            "paragraph": {"rich_text": [{"plain_text": "note"}]},
+        }
+        response = mock.Mock(status_code=200, headers={})
+        config = load_config("missing-config.json")
+        config["settings"]["validate_config_on_startup"] = False
+
+        for strict_verify, expected_calls in ((False, ["PATCH"]), (True, ["PATCH", "GET"])):
+            config["settings"]["audit"]["strict_verify"] = strict_verify
+            audit_logger = StubAuditLogger()
+            engine = ScalersSlackEngine(
+                config=config,
+                notion_client=NotionClient(token="x"),
+                audit_logger=audit_logger,
+            )
+            response.json.side_effect = [{"results": [block]}, block]
+            with mock.patch("requests.request", return_value=response) as request_mock:
+                engine._write_notion_audit_note("note", "page-1", "run-1")
+
+            self.assertEqual([call.args[0] for call in request_mock.call_args_list], expected_calls)
+            self.assertEqual(audit_logger.records[-1]["status"], "completed")
+            self.assertEqual(engine.notion._write_results, {})
+
+    def test_unverified_notion_writes_leave_no_stored_responses(self):
+        config = load_config("missing-config.json")
+        config["settings"]["validate_config_on_startup"] = False
+        notion = NotionClient(token="x")
+        notion.supports_verification = False
+        engine = ScalersSlackEngine(config=config, notion_client=notion, audit_logger=StubAuditLogger())
+        response = mock.Mock(status_code=200, headers={})
+        response.json.side_effect = [{"results": [{"id": "block-1"}]}, {"id": "page-2"}]
+
+        with mock.patch("requests.request", return_value=response):
+            engine._write_notion_audit_note("note", "page-1", "run-1")
+            engine._update_notion_last_synced("page-2", "Last Synced", "2026-01-05T00:00:00+00:00", "run-1")
+
+        self.assertEqual(notion._write_results, {})
+
+    def test_verify_notion_block_compares_segments_like_joined_text(self):
+        def block(*segments):
+            return {"type": "paragraph", "paragraph": {"rich_text": [{"plain_text": seg} for seg in segments]}}
+
+        verify = ScalersSlackEngine._verify_notion_block
+        self.assertTrue(verify(None, block("\n Run ", "ID: 1", "", "\n"), "Run ID: 1"))
+        self.assertTrue(verify(None, block("Run ID: 1  ", " "), " Run ID: 1\n"))
+        self.assertFalse(verify(None, block("Run ", "ID: 2"), "Run ID: 1"))
+        self.assertFalse(verify(None, block("Run ID: 1", " extra"), "Run ID: 1"))
+        self.assertFalse(verify(None, block("Run"), "Run ID: 1"))
+
+    def test_collect_activity_applies_project_pagination_overrides(self):
+        config = load_config("missing-config.json")
+        config["settings"]["validate_config_on_startup"] = False
+        config["settings"]["slack"]["pagination"]["history_max_pages"] = 2
+        config["projects"] = [
+            {"name": "tuned", "slack_channel_id": "C123", "slack_pagination": {"history_limit": "50"}},
+            {"name": "plain", "slack_channel_id": "C456"},
+        ]
+        extractor = StubThreadExtractor([])
+        engine = ScalersSlackEngine(config=config, audit_logger=StubAuditLogger(), thread_extractor=extractor)
+
+        engine.collect_activity("tuned")
+        self.assertEqual(extractor.last_page_args, (50, 2))
+        engine.collect_activity("plain")
+        self.assertEqual(extractor.last_page_args, (200, 2))
+
+    def test_browser_config_built_on_demand_when_browser_unused(self):
+        config = load_config("missing-config.json")
+        config["settings"]["validate_config_on_startup"] = False
+        config["settings"]["browser_automation"]["timeout_ms"] = "4500"
+        engine = ScalersSlackEngine(config=config, audit_logger=StubAuditLogger())
+
+        self.assertIsNone(engine.browser_session)
+        self.assertNotIn("browser_config", vars(engine))
+        self.assertEqual(engine.browser_config.timeout_ms, 4500)
+
+    def test_audit_note_resolves_each_missing_user_once(self):
+        slack = mock.Mock()
+        slack.get_user_info.side_effect = lambda user_id: {"real_name": f"Name {user_id}"}
+        slack.get_channel_info.return_value = {"name": "demo"}
+        audit_logger = StubAuditLogger()
+        audit_logger.user_names["U1"] = "Cached One"
+        config = load_config("missing-config.json")
+        config["settings"]["validate_config_on_startup"] = False
+        engine = ScalersSlackEngine(config=config, slack_client=slack, audit_logger=audit_logger)
+        threads = [
+            Thread(f"{i}.0", "C123", None, f"t{i}", 1, user_id=user_id)
+            for i, user_id in enumerate(["U1", "U2", "U3", "U2", None])
+        ]
+
+        note = engine._build_audit_note("demo", "2024-01-01T00:00:00+00:00", threads, "run-1", "C123")
+
+        self.assertCountEqual([call.args[0] for call in slack.get_user_info.call_args_list], ["U2", "U3"])
+        self.assertIn("| Cached One | t0", note)
+        self.assertIn("| Name U2 | t3", note)
+        self.assertIn("| unknown | t4", note)
+
+
+class ConfigLoaderCacheTests(unittest.TestCase):
+    def test_cached_config_is_isolated_and_reloaded_on_change(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "config.json")
+            with open(config_path, "w") as handle:
+                json.dump({"projects": [{"name": "demo"}]}, handle)
+
+            first = load_config(config_path)
+            first["projects"].append({"name": "mutated"})
+            self.assertEqual(load_config(config_path)["projects"], [{"name": "demo"}])
+
+            with open(config_path, "w") as handle:
+                json.dump({"projects": [{"name": "renamed"}]}, handle)
+            stat = os.stat(config_path)
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(load_config(config_path)["projects"], [{"name": "renamed"}])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest import mock
 
@@ -71,6 +72,38 @@ class RetryTests(unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 client._request("PATCH", "blocks/abc/children", json_body={}, idempotent=False)
 
+    def test_notion_body_encoded_once_across_retries(self):
+        responses = [
+            FakeResponse(503, {"object": "error"}),
+            FakeResponse(200, {"object": "list"}),
+        ]
+        bodies = []
+
+        def fake_request(*args, **kwargs):
+            bodies.append(kwargs["data"])
+            return responses.pop(0)
+
+        with mock.patch("requests.request", side_effect=fake_request), mock.patch("time.sleep"):
+            client = NotionClient(
+                token="x",
+                retry_config={"max_attempts": 2, "backoff_base": 0, "backoff_max": 0, "jitter": 0},
+            )
+            client._request("POST", "search", json_body={"query": "démo"}, idempotent=True)
+
+        self.assertIs(bodies[0], bodies[1])
+        self.assertEqual(json.loads(bodies[0]), {"query": "démo"})
+
+    def test_clients_send_through_shared_session(self):
+        session = mock.Mock(spec=requests.Session)
+        session.request.side_effect = [FakeResponse(200, {"ok": True}), FakeResponse(200, {"object": "page"})]
+
+        with mock.patch("requests.request") as module_request:
+            SlackClient(token="x", http=session)._request("GET", "auth.test")
+            NotionClient(token="x", http=session)._request("GET", "pages/abc")
+
+        self.assertEqual(session.request.call_count, 2)
+        module_request.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,3 +15,20 @@ def test_mark_task_complete_counts_once_for_same_task(tmp_path):
     assert stats["total_tasks"] == 1
     assert stats["total_completions"] == 1
     assert memory.data["metadata"]["total_tasks_tracked"] == 1
+
+
+def test_get_tasks_grouped_by_assignee_matches_per_assignee_lookup(tmp_path):
+    """Bulk grouping should return the same tasks as individual assignee lookups."""
+    memory = TaskMemory(str(tmp_path / "task_memory.json"))
+    memory.add_task(task_name="Homepage polish", assignee="Alice")
+    memory.add_task(task_name="Footer links", assignee="alice")
+    memory.add_task(task_name="Blog layout", assignee="Bob")
+    memory.add_task(task_name="Unrelated", assignee="Carol")
+
+    grouped = memory.get_tasks_grouped_by_assignee(["Alice", "Bob", "Dana"])
+
+    assert set(grouped) == {"Alice", "Bob", "Dana"}
+    for name, tasks in grouped.items():
+        expected = [t.task_id for t in memory.get_tasks_by_assignee(name)]
+        assert [t.task_id for t in tasks] == expected
+    assert grouped["Dana"] == []
@@ -0,0 +1,46 @@
+import unittest
+
+from src.thread_extractor import ThreadExtractor
+
+
+class StubSlackClient:
+    def __init__(self, messages):
+        self.messages = messages
+
+    def fetch_channel_history_paginated(self, channel_id, latest=None, oldest=None, limit=200, max_pages=10):
+        return self.messages
+
+    def search_messages_paginated(self, query, count=100, max_pages=5):
+        return self.messages
+
+
+class ThreadExtractorTests(unittest.TestCase):
+    def test_fetch_channel_threads_groups_replies_under_parent(self):
+        messages = [
+            {"ts": "100.0", "user": "U1", "text": "parent"},
+            {"ts": "101.0", "thread_ts": "100.0", "text": "reply one"},
+            {"ts": "102.0", "thread_ts": "100.0", "text": "reply two"},
+            {"ts": "200.0", "user": "U2", "text": "solo", "reply_count": 4},
+            {"text": "no timestamp"},
+        ]
+        threads = ThreadExtractor(StubSlackClient(messages)).fetch_channel_threads("C123")
+
+        self.assertEqual([t.thread_ts for t in threads], ["100.0", "200.0"])
+        parent, solo = threads
+        self.assertEqual(
+            (parent.text, parent.user_id, parent.message_count, parent.reply_count), ("parent", "U1", 3, 2)
+        )
+        self.assertEqual((solo.message_count, solo.reply_count, solo.channel_id), (1, 4, "C123"))
+
+    def test_search_threads_filters_by_channel(self):
+        messages = [
+            {"ts": "100.0", "text": "keep", "channel": {"id": "C123"}},
+            {"ts": "101.0", "text": "drop", "channel": {"id": "C999"}},
+        ]
+        threads = ThreadExtractor(StubSlackClient(messages)).search_threads("keep", channel_id="C123")
+
+        self.assertEqual([(t.thread_ts, t.channel_id) for t in threads], [("100.0", "C123")])
+
+
+if __name__ == "__main__":
+    unittest.main()